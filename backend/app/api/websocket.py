@@ -104,6 +104,9 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     }
     ```
 
+    Several messages may be batched into one frame as a JSON array; each
+    gets its own response, in order.
+
     Supported client message types:
     - subscribe: Subscribe with optional filters
     - unsubscribe: Clear all filters
@@ -137,8 +140,11 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             # Handle message
             response = await manager.handle_client_message(client_id, message_text)
 
-            # Send response if any
-            if response:
+            # Send response(s) if any - batched frames get one response per message
+            if isinstance(response, list):
+                for item in response:
+                    await websocket.send_json(item)
+            elif response:
                 await websocket.send_json(response)
 
     except WebSocketDisconnect:
@@ -3,7 +3,7 @@ import asyncio
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Union
 
 from fastapi import WebSocket, WebSocketDisconnect
 from pydantic import ValidationError
@@ -74,19 +74,51 @@ class ConnectionManager:
 
     async def handle_client_message(
         self, client_id: str, message_text: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Handle incoming message from client.
 
+        A frame may carry a single message object or a JSON array of them;
+        clients batch control messages (subscribe/unsubscribe/ping) that way
+        to send one frame per burst.
+
         Args:
             client_id: Client identifier
             message_text: Raw message text
 
         Returns:
-            Response message if applicable
+            Response message if applicable, or a list of responses for a batch
         """
         try:
             message_data = json.loads(message_text)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Invalid JSON from client {client_id}: {message_text[:100]}")
+            return {"type": WSMessageType.ERROR, "message": "Invalid JSON"}
+
+        if isinstance(message_data, list):
+            return [await self._handle_message(client_id, item) for item in message_data]
+
+        return await self._handle_message(client_id, message_data)
+
+    async def _handle_message(self, client_id: str, message_data: Any) -> Dict[str, Any]:
+        """
+        Handle a single decoded client message.
+
+        Args:
+            client_id: Client identifier
+            message_data: Decoded JSON value; anything but an object is rejected
+
+        Returns:
+            Response message
+        """
+        if not isinstance(message_data, dict):
+            logger.warning(
+                f"Invalid message format from client {client_id}: "
+                f"expected an object, got {type(message_data).__name__}"
+            )
+            return {"type": WSMessageType.ERROR, "message": "Invalid message format"}
+
+        try:
             message_type = message_data.get("type")
 
             if message_type == WSMessageType.SUBSCRIBE:
@@ -115,9 +147,6 @@ class ConnectionManager:
                     "message": f"Unknown message type: {message_type}",
                 }
 
-        except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON from client {client_id}: {message_text[:100]}")
-            return {"type": WSMessageType.ERROR, "message": "Invalid JSON"}
         except ValidationError as e:
             logger.warning(f"Invalid message format from client {client_id}: {e}")
             return {"type": WSMessageType.ERROR, "message": "Invalid message format", "details": str(e)}
@@ -128,7 +157,7 @@ class ConnectionManager:
             logger.critical(
                 f"Unexpected error processing message from client {client_id}: {e}",
                 exc_info=True,
-                extra={"client_id": client_id, "message": message_text[:200]}
+                extra={"client_id": client_id, "message": str(message_data)[:200]}
             )
             return {"type": WSMessageType.ERROR, "message": "Internal server error"}
 
@@ -135,6 +135,66 @@ class TestWebSocketSubscription:
             assert data["type"] == "pong"
             assert "timestamp" in data
 
+    def test_websocket_batched_messages(
+        self, client: AsyncClient, admin_token: str
+    ):
+        """Test a JSON array frame gets one response per message, in order."""
+        sync_client = TestClient(app)
+
+        with sync_client.websocket_connect(f"/api/ws?token={admin_token}") as websocket:
+            # Receive connection ack
+            websocket.receive_json()
+
+            # Send batched control messages in one frame
+            websocket.send_text(json.dumps([
+                {"type": "subscribe", "filters": {"direction": "IB"}},
+                {"type": "ping"},
+            ]))
+
+            # Receive one response per batched message
+            data = websocket.receive_json()
+            assert data["type"] == "subscribe_ack"
+            assert data["filters"]["direction"] == "IB"
+
+            data = websocket.receive_json()
+            assert data["type"] == "pong"
+
+    def test_websocket_malformed_batch(
+        self, client: AsyncClient, admin_token: str
+    ):
+        """Test non-object batch items get a per-item error and valid items still run."""
+        sync_client = TestClient(app)
+
+        with sync_client.websocket_connect(f"/api/ws?token={admin_token}") as websocket:
+            # Receive connection ack
+            websocket.receive_json()
+
+            websocket.send_text(json.dumps([1, "x", {"type": "ping"}]))
+
+            for _ in range(2):
+                data = websocket.receive_json()
+                assert data == {"type": "error", "message": "Invalid message format"}
+
+            data = websocket.receive_json()
+            assert data["type"] == "pong"
+
+    def test_websocket_empty_batch(
+        self, client: AsyncClient, admin_token: str
+    ):
+        """Test an empty batch gets no response and leaves the connection usable."""
+        sync_client = TestClient(app)
+
+        with sync_client.websocket_connect(f"/api/ws?token={admin_token}") as websocket:
+            # Receive connection ack
+            websocket.receive_json()
+
+            websocket.send_text("[]")
+            websocket.send_json({"type": "ping"})
+
+            # The first reply is the pong: nothing was sent for the empty batch
+            data = websocket.receive_json()
+            assert data["type"] == "pong"
+
     def test_websocket_invalid_message_type(
         self, client: AsyncClient, admin_token: str
     ):
@@ -0,0 +1,42 @@
+"""Date/time helpers for RampForge TUI client."""
+from datetime import datetime
+
+
+def parse_local_datetime(value: str) -> datetime:
+    """
+    Parse a "YYYY-MM-DD HH:MM" string into a naive datetime.
+
+    Equivalent to datetime.strptime(value, "%Y-%m-%d %H:%M") for
+    zero-padded input, but slices the fixed layout directly instead of going
+    through the _strptime regex machinery. Unlike strptime, every field must
+    be zero-padded: "2024-1-5 9:30" is rejected.
+
+    Args:
+        value: Date/time string as typed into the modal inputs
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the string does not match the layout or is out of range
+    """
+    if (
+        len(value) != 16
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] != " "
+        or value[13] != ":"
+    ):
+        raise ValueError(f"Expected YYYY-MM-DD HH:MM, got {value!r}")
+
+    digits = value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16]
+    if not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Expected YYYY-MM-DD HH:MM, got {value!r}")
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -344,15 +344,30 @@ class DockDashboardScreen(Screen):
             button = self.query_one(f"#{button_id}", Button)
             button.variant = "primary" if active else "default"
 
-    def _update_summary_widgets(self) -> None:
-        """Refresh summary widgets (stats panel + sidebar)."""
+    def _update_summary_widgets(
+        self,
+        delta: Optional[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Refresh summary widgets (stats panel + sidebar).
+
+        Args:
+            delta: (old, new) assignment pair when a single assignment changed;
+                   None triggers a full stats recompute.
+        """
         total = len(self.ramp_infos)
         busy = sum(1 for info in self.ramp_infos if not info.is_free)
         blocked = sum(1 for info in self.ramp_infos if info.is_blocked)
         overdue = sum(1 for info in self.ramp_infos if info.is_overdue)
 
         stats_panel = self.query_one("#stats-panel", StatsPanel)
-        stats_panel.update_stats(self.assignments, total_ramps=total, blocked=blocked, overdue=overdue)
+        if delta is not None:
+            old, new = delta
+            stats_panel.apply_delta(old, new, blocked=blocked, overdue=overdue)
+        else:
+            stats_panel.update_stats(
+                self.assignments, total_ramps=total, blocked=blocked, overdue=overdue
+            )
 
         sidebar = self.query_one(FilterSidebar)
         sidebar.update_summary(SidebarSummary(total=total, busy=busy, blocked=blocked, overdue=overdue))
@@ -360,9 +375,33 @@ class DockDashboardScreen(Screen):
     # ------------------------------------------------------------------#
     # Event handlers
     # ------------------------------------------------------------------#
-    async def _handle_assignment_event(self, _: Dict[str, Any]) -> None:
-        """React to WebSocket updates."""
-        await self.action_refresh()
+    async def _handle_assignment_event(self, message: Dict[str, Any]) -> None:
+        """React to WebSocket updates by applying the changed assignment locally."""
+        assignment_id = message.get("assignment_id")
+        new = message.get("data")
+        if assignment_id is None or not isinstance(new, dict):
+            await self.action_refresh()
+            return
+        if message.get("type") == "assignment_deleted":
+            new = None
+
+        index = next(
+            (i for i, a in enumerate(self.assignments) if a.get("id") == assignment_id),
+            None,
+        )
+        old = self.assignments[index] if index is not None else None
+        if new is None:
+            if index is not None:
+                del self.assignments[index]
+        elif index is None:
+            self.assignments.append(new)
+        else:
+            self.assignments[index] = new
+
+        self.ramp_infos = get_ramp_statuses(self.ramps, self.assignments)
+        self._hydrate_status_options()
+        self._apply_filters()
+        self._update_summary_widgets(delta=(old, new))
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:  # type: ignore[override]
         """Handle filter buttons."""
@@ -1,5 +1,5 @@
 """API client for RampForge backend."""
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 from pydantic import BaseModel
@@ -21,11 +21,28 @@ class APIError(Exception):
 class APIClient:
     """HTTP client for RampForge API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000") -> None:
-        """Initialize API client."""
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        client_factory: Optional[Callable[..., httpx.AsyncClient]] = None,
+    ) -> None:
+        """
+        Initialize API client.
+
+        Args:
+            base_url: API server URL
+            client_factory: Builds the HTTP client used for each request
+                (default: httpx.AsyncClient); tests inject a fake here
+        """
         self.base_url = base_url
         self.token: Optional[str] = None
         self.user_data: Optional[Dict[str, Any]] = None
+        self._client_factory = client_factory
+
+    def _http(self, **kwargs: Any) -> httpx.AsyncClient:
+        """Create the HTTP client for one request."""
+        factory = self._client_factory or httpx.AsyncClient
+        return factory(**kwargs)
 
     async def login(self, email: str, password: str) -> Dict[str, Any]:
         """
@@ -41,7 +58,7 @@ class APIClient:
         Raises:
             APIError: If login fails
         """
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f"{self.base_url}/api/auth/login",
                 json={"email": email, "password": password},
@@ -71,7 +88,7 @@ class APIClient:
     async def get_assignments(self, direction: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all assignments."""
         params = {"direction": direction} if direction else {}
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self._http(timeout=30.0) as client:
             try:
                 response = await client.get(
                     f"{self.base_url}/api/assignments/",
@@ -93,7 +110,7 @@ class APIClient:
 
     async def get_assignment(self, assignment_id: int) -> Dict[str, Any]:
         """Get assignment by ID."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.base_url}/api/assignments/{assignment_id}",
                 headers=self._headers(),
@@ -104,7 +121,7 @@ class APIClient:
 
     async def create_assignment(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new assignment."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f"{self.base_url}/api/assignments/",
                 headers=self._headers(),
@@ -118,7 +135,7 @@ class APIClient:
         self, assignment_id: int, data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Update assignment."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.patch(
                 f"{self.base_url}/api/assignments/{assignment_id}",
                 headers=self._headers(),
@@ -134,7 +151,7 @@ class APIClient:
 
     async def delete_assignment(self, assignment_id: int) -> None:
         """Delete assignment."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.delete(
                 f"{self.base_url}/api/assignments/{assignment_id}",
                 headers=self._headers(),
@@ -144,7 +161,7 @@ class APIClient:
 
     async def get_ramps(self) -> List[Dict[str, Any]]:
         """Get all ramps."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.base_url}/api/ramps/",
                 headers=self._headers(),
@@ -156,7 +173,7 @@ class APIClient:
     async def get_loads(self, direction: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all loads."""
         params = {"direction": direction} if direction else {}
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.base_url}/api/loads/",
                 headers=self._headers(),
@@ -168,7 +185,7 @@ class APIClient:
 
     async def get_statuses(self) -> List[Dict[str, Any]]:
         """Get all statuses."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.base_url}/api/statuses/",
                 headers=self._headers(),
@@ -179,7 +196,7 @@ class APIClient:
 
     async def get_users(self) -> List[Dict[str, Any]]:
         """Get all users (admin only)."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.get(
                 f"{self.base_url}/api/users/",
                 headers=self._headers(),
@@ -190,7 +207,7 @@ class APIClient:
 
     async def create_load(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new load."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f"{self.base_url}/api/loads/",
                 headers=self._headers(),
@@ -202,7 +219,7 @@ class APIClient:
 
     async def create_ramp(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new ramp (admin only)."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f"{self.base_url}/api/ramps/",
                 headers=self._headers(),
@@ -214,7 +231,7 @@ class APIClient:
 
     async def create_user(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new user (admin only)."""
-        async with httpx.AsyncClient() as client:
+        async with self._http() as client:
             response = await client.post(
                 f"{self.base_url}/api/users/",
                 headers=self._headers(),
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import Any, Dict, List, Optional
 
 from dateutil import parser
@@ -16,6 +17,13 @@ class RampStatus(Enum):
     BLOCKED = "blocked"
 
 
+_STATUS_DISPLAY: Dict[RampStatus, str] = {
+    RampStatus.FREE: "🟢 FREE",
+    RampStatus.OCCUPIED: "🔴 OCCUPIED",
+    RampStatus.BLOCKED: "⚫ BLOCKED",
+}
+
+
 class RampInfo:
     """Information about a ramp and its current status."""
 
@@ -236,6 +244,66 @@ class RampInfo:
             return True
         return query.lower() in self._search_blob
 
+    # ---------------------------------------------------------------------#
+    # Presentation
+    # ---------------------------------------------------------------------#
+    @property
+    def status_display(self) -> str:
+        """Return status label with emoji for tiles."""
+        return _STATUS_DISPLAY.get(self.status, "❓ UNKNOWN")
+
+    @cached_property
+    def tile_content(self) -> str:
+        """Return rendered markup for a ramp tile (built once per instance)."""
+        lines = [f"[bold]{self.ramp_code}[/bold]", self.status_display]
+
+        if self.is_occupied:
+            lines.append(f"{self.load_ref}")
+            if self.eta_out:
+                lines.append(f"Out: {_format_eta(self.eta_out)}")
+        elif self.is_blocked:
+            notes = self.notes or "Blocked"
+            lines.append(f"{notes[:20]}")
+        else:
+            lines.append("Available")
+
+        return "\n".join(lines)
+
+    @cached_property
+    def detail_markup(self) -> str:
+        """Return rendered markup for the detail panel (built once per instance)."""
+        # One entry per rendered line; values are formatted, never concatenated,
+        # since API fields may be None or ints
+        lines = [
+            "[bold cyan]Ramp[/bold cyan]",
+            f"Code: [white]{self.ramp_code}[/white]",
+        ]
+        if self.zone:
+            lines.append(f"Zone: [white]{self.zone}[/white]")
+        lines += [
+            "",
+            "[bold yellow]Load[/bold yellow]",
+            f"Status: [white]{self.status_label}[/white]",
+            f"Direction: [white]{self.direction_label}[/white]",
+            f"Reference: [white]{self.load_ref or '-'}[/white]",
+            f"ETA In: [white]{_format_dt(self.eta_in_dt)}[/white]",
+            f"ETA Out: [white]{_format_dt(self.eta_out_dt)}[/white]",
+        ]
+        if self.notes:
+            lines += ["", "[bold green]Notes[/bold green]", str(self.notes).strip()]
+        lines += [
+            "",
+            "[bold magenta]Activity[/bold magenta]",
+            f"Created: [white]{_format_dt(self.created_at_dt)}[/white]",
+            f"Updated: [white]{_format_dt(self.updated_at_dt)}[/white]",
+        ]
+        user = self.last_event_user
+        if user:
+            lines.append(f"By: [white]{user}[/white]")
+        if self.version is not None:
+            lines.append(f"Version: [white]{self.version}[/white]")
+        return "\n".join(lines)
+
     # ---------------------------------------------------------------------#
     # Internal helpers
     # ---------------------------------------------------------------------#
@@ -265,6 +333,26 @@ class RampInfo:
         return " ".join(p for p in parts if p).lower()
 
 
+@lru_cache(maxsize=512)
+def _format_eta(eta: str) -> str:
+    """Format ETA for tiles (cached, ETA strings repeat across refreshes)."""
+    if len(eta) < 10:
+        return eta
+    try:
+        # Python 3.11+ parses a trailing 'Z' natively
+        dt = datetime.fromisoformat(eta)
+    except ValueError:
+        return eta[:16]
+    return dt.strftime("%H:%M")
+
+
+def _format_dt(value: Optional[datetime]) -> str:
+    """Format datetimes nicely for the detail sidebar."""
+    if not value:
+        return "-"
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
 def get_ramp_statuses(ramps: List[Dict[str, Any]], assignments: List[Dict[str, Any]]) -> List[RampInfo]:
     """
     Return ramp status info for all ramps.
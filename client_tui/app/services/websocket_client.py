@@ -1,15 +1,44 @@
 """WebSocket client for real-time updates."""
 import asyncio
-import json
-from typing import Any, Callable, Dict, Optional
-
+import inspect
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+import orjson
 import websockets
+from websockets import connect as _ws_connect
 from websockets.client import WebSocketClientProtocol
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds to wait for the WebSocket handshake before giving up
+CONNECT_TIMEOUT = 10.0
+
+# Handler for one decoded server message; coroutine handlers are scheduled as tasks
+MessageCallback = Callable[[Dict[str, Any]], Optional[Awaitable[None]]]
+
+# Outbound messages kept while waiting to be sent; past this the oldest are dropped
+_OUT_MAXLEN = 1024
+
+# Control messages without parameters never change; serialize them once
+_SUBSCRIBE_ALL = orjson.dumps({"type": "subscribe"}).decode()
+_UNSUBSCRIBE = orjson.dumps({"type": "unsubscribe"}).decode()
+_PING = orjson.dumps({"type": "ping"}).decode()
+
 
 class WebSocketClient:
     """
@@ -19,8 +48,32 @@ class WebSocketClient:
     - Automatic reconnection with exponential backoff
     - Connection status callbacks
     - Secure header-based JWT authentication
+    - Outbound control messages batched into one frame per burst
     """
 
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        "base_url",
+        "websocket",
+        "token",
+        "callbacks",
+        "_generic_cb",
+        "running",
+        "_task",
+        "_callback_tasks",
+        "_out",
+        "_out_waiter",
+        "_dropped",
+        "_writer_task",
+        "_batch_depth",
+        "_uncorked",
+        "max_retries",
+        "auto_reconnect",
+        "retry_count",
+        "reconnecting",
+        "on_connection_change",
+    )
+
     def __init__(
         self,
         base_url: str = "ws://localhost:8000",
@@ -38,9 +91,26 @@ class WebSocketClient:
         self.base_url = base_url
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.token: Optional[str] = None
-        self.callbacks: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        # Allocated on first on_message(); most clients register few or none
+        self.callbacks: Optional[Dict[str, MessageCallback]] = None
+        # The "*" callback is kept out of the dict so dispatch skips a lookup
+        self._generic_cb: Optional[MessageCallback] = None
         self.running = False
-        self._task: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        # Tasks running async callbacks; referenced here so they aren't collected
+        self._callback_tasks: Set[asyncio.Task[None]] = set()
+
+        # Serialized outbound control messages, drained by a single writer task.
+        # With one consumer a deque plus a wake-up future is all that's needed;
+        # asyncio.Queue's getter/putter bookkeeping buys nothing here.
+        self._out: Deque[str] = deque(maxlen=_OUT_MAXLEN)
+        self._out_waiter: Optional[asyncio.Future[None]] = None
+        # Outbound messages lost to a full queue or a failed send
+        self._dropped = 0
+        self._writer_task: Optional[asyncio.Task[None]] = None
+        self._batch_depth = 0
+        self._uncorked = asyncio.Event()
+        self._uncorked.set()
 
         # Reconnection settings
         self.max_retries = max_retries
@@ -63,9 +133,14 @@ class WebSocketClient:
         """
         self.on_connection_change = callback
 
-    def on_message(self, message_type: str, callback: Callable[[Dict[str, Any]], None]) -> None:
-        """Register callback for message type."""
-        self.callbacks[message_type] = callback
+    def on_message(self, message_type: str, callback: MessageCallback) -> None:
+        """Register callback for message type ("*" receives every message)."""
+        if message_type == "*":
+            self._generic_cb = callback
+        else:
+            if self.callbacks is None:
+                self.callbacks = {}
+            self.callbacks[message_type] = callback
 
     async def connect(self) -> None:
         """
@@ -92,16 +167,20 @@ class WebSocketClient:
         try:
             # Add timeout to prevent hanging
             # Send JWT token in subprotocols header for security
-            self.websocket = await asyncio.wait_for(
-                websockets.connect(
+            # Messages are small JSON; permessage-deflate costs more CPU than it saves
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                self.websocket = await _ws_connect(
                     uri,
-                    subprotocols=[f"Bearer.{self.token}"]
-                ),
-                timeout=10.0
-            )
+                    subprotocols=[f"Bearer.{self.token}"],
+                    compression=None,
+                )
             self.running = True
             self.retry_count = 0  # Reset on successful connection
             self._task = asyncio.create_task(self._listen())
+            # The writer stops when a send hits a closed socket; restart it so
+            # messages requeued by that send go out on the new connection
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.create_task(self._writer())
 
             logger.info(f"WebSocket connected to {self.base_url}")
             if self.on_connection_change:
@@ -158,22 +237,32 @@ class WebSocketClient:
         if not self.websocket:
             return
 
+        # Callbacks are re-read per message rather than hoisted: dashboards
+        # register them after connect() has already started this listener
+        loads = orjson.loads
         try:
             async for message in self.websocket:
-                data = json.loads(message)
-                message_type = data.get("type")
+                data: Dict[str, Any] = loads(message)
+                message_type = data.get("type", "")
 
                 # Call registered callback
-                if message_type in self.callbacks:
+                callbacks = self.callbacks
+                callback = callbacks.get(message_type) if callbacks else None
+                if callback is not None:
                     try:
-                        self.callbacks[message_type](data)
+                        result = callback(data)
+                        if inspect.isawaitable(result):
+                            self._schedule_callback(result)
                     except Exception as e:
                         logger.error(f"Error in callback for {message_type}: {e}", exc_info=True)
 
                 # Call generic callback if registered
-                if "*" in self.callbacks:
+                generic_cb = self._generic_cb
+                if generic_cb is not None:
                     try:
-                        self.callbacks["*"](data)
+                        result = generic_cb(data)
+                        if inspect.isawaitable(result):
+                            self._schedule_callback(result)
                     except Exception as e:
                         logger.error(f"Error in generic callback: {e}", exc_info=True)
 
@@ -202,34 +291,189 @@ class WebSocketClient:
         finally:
             logger.debug("WebSocket listener stopped")
 
+    def _schedule_callback(self, awaitable: Awaitable[None]) -> None:
+        """Run an async callback's result as a task so it doesn't block the listener."""
+        task = asyncio.ensure_future(awaitable)
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task[None]) -> None:
+        """Drop a finished callback task and log its error, if any."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            error = task.exception()
+            logger.error(f"Error in async callback: {error}", exc_info=error)
+
+    async def _writer(self) -> None:
+        """Send queued control messages, coalescing each burst into one frame."""
+        loop = asyncio.get_running_loop()
+        while True:
+            while not self._out:
+                self._out_waiter = loop.create_future()
+                try:
+                    await self._out_waiter
+                finally:
+                    self._out_waiter = None
+            # Stay parked while a batch() block is open; its exit sends everything
+            await self._uncorked.wait()
+            batch = self._drain_queue()
+            if batch and not await self._send_frame(batch):
+                # Socket is gone; the batch is requeued for the next connection
+                return
+
+    def _enqueue(self, payload: str) -> None:
+        """Queue a serialized message and wake the writer if it is idle."""
+        if len(self._out) == _OUT_MAXLEN:
+            self._record_dropped(1)
+        self._out.append(payload)
+        self._wake_writer()
+
+    def _wake_writer(self) -> None:
+        """Resolve the idle writer's wake-up future, if it is parked."""
+        waiter = self._out_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _requeue(self, batch: List[str]) -> None:
+        """Put an unsent batch back at the head of the queue, oldest first."""
+        overflow = len(batch) + len(self._out) - _OUT_MAXLEN
+        if overflow > 0:
+            self._record_dropped(overflow)
+        # deque(maxlen=...) keeps the newest items, matching append()'s overflow
+        self._out = deque([*batch, *self._out], maxlen=_OUT_MAXLEN)
+        self._wake_writer()
+
+    def _record_dropped(self, count: int) -> None:
+        """Count and report outbound messages that will never be sent."""
+        self._dropped += count
+        logger.warning(
+            f"Dropped {count} outbound WebSocket message(s) ({self._dropped} total)"
+        )
+
+    def _drain_queue(self) -> List[str]:
+        """Take every message currently waiting to be sent, in order."""
+        batch = list(self._out)
+        self._out.clear()
+        return batch
+
+    async def _send_frame(self, batch: List[str]) -> bool:
+        """
+        Send a batch of serialized messages as a single WebSocket frame.
+
+        A lone message goes out as a plain object; larger batches are joined
+        into a JSON array, which the server answers message by message.
+
+        Returns:
+            False if there is no open socket; the batch is then requeued
+        """
+        if not self.websocket:
+            self._requeue(batch)
+            return False
+
+        payload = batch[0] if len(batch) == 1 else f"[{','.join(batch)}]"
+        try:
+            # Sent as str so the frame goes out as text, which the server expects
+            await self.websocket.send(payload)
+        except websockets.exceptions.ConnectionClosed as e:
+            # _listen notices the closed socket and handles reconnection
+            logger.warning(f"Requeued {len(batch)} outbound message(s) after close: {e}")
+            self._requeue(batch)
+            return False
+        except Exception as e:
+            logger.error(f"Failed to send WebSocket messages: {e}", exc_info=True)
+            self._record_dropped(len(batch))
+        return True
+
+    def send_batch(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Queue messages for the writer to send in as few frames as possible."""
+        for message in messages:
+            self._enqueue(orjson.dumps(message).decode())
+
+    @property
+    def writer_running(self) -> bool:
+        """Whether the writer task is alive to send queued messages."""
+        return self._writer_task is not None and not self._writer_task.done()
+
+    async def flush(self) -> None:
+        """
+        Send all queued messages now, in one frame, without waiting for the writer.
+
+        Raises:
+            RuntimeError: If the writer is not running (not connected, or the
+                socket closed); queued messages are sent once it restarts
+        """
+        if not self.writer_running:
+            raise RuntimeError("WebSocket writer is not running; connect() first")
+        batch = self._drain_queue()
+        if batch:
+            await self._send_frame(batch)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Hold outbound messages until the block exits, then send them as one frame.
+
+        The counterpart of a socket cork/uncork: the writer does not send while
+        any batch() block is open, even if the block awaits in between.
+        """
+        self._batch_depth += 1
+        self._uncorked.clear()
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._uncorked.set()
+                # Without a writer the messages stay queued until connect()
+                if self.writer_running:
+                    await self.flush()
+
     async def subscribe(self, direction: Optional[str] = None) -> None:
         """Subscribe with optional direction filter."""
         if not self.websocket:
             return
 
-        message = {"type": "subscribe"}
-        if direction:
-            message["filters"] = {"direction": direction}
+        if not direction:
+            self._enqueue(_SUBSCRIBE_ALL)
+            return
 
-        await self.websocket.send(json.dumps(message))
+        message = {"type": "subscribe", "filters": {"direction": direction}}
+        self._enqueue(orjson.dumps(message).decode())
 
     async def unsubscribe(self) -> None:
         """Clear all filters."""
         if not self.websocket:
             return
 
-        await self.websocket.send(json.dumps({"type": "unsubscribe"}))
+        self._enqueue(_UNSUBSCRIBE)
 
     async def ping(self) -> None:
         """Send ping to keep connection alive."""
         if not self.websocket:
             return
 
-        await self.websocket.send(json.dumps({"type": "ping"}))
+        self._enqueue(_PING)
 
     async def disconnect(self) -> None:
-        """Disconnect from WebSocket."""
+        """Disconnect from WebSocket; no writer or async callback runs afterwards."""
         self.running = False
+        if self.websocket and self.writer_running:
+            await self.flush()
+        if self._writer_task:
+            writer, self._writer_task = self._writer_task, None
+            writer.cancel()
+            with suppress(asyncio.CancelledError):
+                await writer
+
+        # A callback may be the one calling disconnect(); don't cancel it under itself
+        current = asyncio.current_task()
+        callbacks = [task for task in self._callback_tasks if task is not current]
+        self._callback_tasks.clear()
+        for task in callbacks:
+            task.cancel()
+        if callbacks:
+            await asyncio.gather(*callbacks, return_exceptions=True)
+
         if self.websocket:
             await self.websocket.close()
         if self._task:
@@ -8,6 +8,7 @@ from textual.containers import Container, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Select, Static
 
+from app.core.datetime_utils import parse_local_datetime
 from app.services import APIClient
 
 logger = logging.getLogger(__name__)
@@ -227,8 +228,8 @@ class CreateAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
 
         try:
             # Parse dates
-            eta_in_dt = datetime.strptime(eta_in, "%Y-%m-%d %H:%M")
-            eta_out_dt = datetime.strptime(eta_out, "%Y-%m-%d %H:%M")
+            eta_in_dt = parse_local_datetime(eta_in)
+            eta_out_dt = parse_local_datetime(eta_out)
 
             # Create assignment
             data = {
@@ -246,7 +247,7 @@ class CreateAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
             self.dismiss(assignment)
 
         except ValueError as e:
-            error_msg.update(f"❌ Invalid date format. Use: YYYY-MM-DD HH:MM")
+            error_msg.update("❌ Invalid date. Use zero-padded YYYY-MM-DD HH:MM, e.g. 2025-01-05 09:30")
             create_button.disabled = False
             loading_msg.update("")
         except Exception as e:
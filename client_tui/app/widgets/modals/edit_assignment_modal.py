@@ -1,4 +1,5 @@
 """Modal for editing assignments."""
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -8,6 +9,7 @@ from textual.containers import Container, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Select, Static
 
+from app.core.datetime_utils import parse_local_datetime
 from app.services import APIClient, APIError
 
 logger = logging.getLogger(__name__)
@@ -101,19 +103,14 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
             yield Static(f"Edit Assignment #{self.assignment['id']}", id="modal-title")
 
             # Show current ramp and load (read-only)
-            ramp = self.assignment.get('ramp', {})
-            load = self.assignment.get('load', {})
-            info_text = (
-                f"Ramp: {ramp.get('code', 'N/A')} - {ramp.get('description', '')}\n"
-                f"Load: {load.get('reference', 'N/A')} ({load.get('direction', '')})"
-            )
-            yield Static(info_text, id="assignment-info")
+            yield Static(self._info_text(self.assignment), id="assignment-info")
 
             yield Label("Status:", classes="field-label")
+            # No placeholder option: nothing is selectable until statuses load
             yield Select(
-                [(f"Loading...", "")],
+                [],
                 id="status-select",
-                prompt="Select status",
+                prompt="Loading...",
             )
 
             yield Label("ETA In (YYYY-MM-DD HH:MM):", classes="field-label")
@@ -136,43 +133,81 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
             yield Static("", id="error-message")
 
     async def on_mount(self) -> None:
-        """Load statuses from API on mount."""
+        """Load statuses and refresh the assignment from API on mount."""
         loading_msg = self.query_one("#loading-message", Static)
         loading_msg.update("⏳ Loading statuses...")
 
         try:
-            # Load statuses from API
-            self.statuses = await self.api_client.get_statuses()
+            # Load statuses and a fresh copy of the assignment concurrently; the
+            # fresh copy carries the current version, avoiding stale 409s on save.
+            statuses, fresh_assignment = await asyncio.gather(
+                self.api_client.get_statuses(),
+                self.api_client.get_assignment(self.assignment['id']),
+                return_exceptions=True,
+            )
+            if isinstance(statuses, BaseException):
+                raise statuses
+            self.statuses = statuses
+
+            if isinstance(fresh_assignment, BaseException):
+                logger.warning("Could not refresh assignment before edit: %s", fresh_assignment)
+            else:
+                self._apply_fresh_assignment(fresh_assignment)
 
             # Update select widget
             status_select = self.query_one("#status-select", Select)
-            status_select.set_options(
-                [(f"{s['label']}", str(s['id'])) for s in self.statuses]
-            )
+            # set_options() rebuilds the blank entry from the current prompt
+            status_select.prompt = "Select status"
+            status_select.set_options([(s['label'], s['id']) for s in self.statuses])
 
-            # Set current status as selected
-            current_status_id = str(self.assignment.get('status_id', ''))
-            status_select.value = current_status_id
+            # Set current status as selected (ids stay ints end-to-end)
+            current_status_id = self.assignment.get('status_id')
+            if current_status_id is not None:
+                status_select.value = current_status_id
 
             loading_msg.update("")
-            logger.info(f"Loaded {len(self.statuses)} statuses")
+            logger.info("Loaded %d statuses", len(self.statuses))
 
         except Exception as e:
-            logger.error(f"Error loading statuses: {e}", exc_info=True)
+            logger.error("Error loading statuses: %s", e, exc_info=True)
             error_msg = self.query_one("#error-message", Static)
             error_msg.update(f"❌ Error loading data: {e}")
             loading_msg.update("")
 
+    def _apply_fresh_assignment(self, fresh: Dict[str, Any]) -> None:
+        """Show a freshly fetched assignment without discarding the user's edits."""
+        previous = self.assignment
+        self.assignment = fresh
+        self.query_one("#assignment-info", Static).update(self._info_text(fresh))
+
+        for field, input_id in (("eta_in", "#eta-in-input"), ("eta_out", "#eta-out-input")):
+            eta_input = self.query_one(input_id, Input)
+            # Only replace what compose() rendered; an edit made while loading wins
+            if eta_input.value == self._format_datetime(previous.get(field)):
+                eta_input.value = self._format_datetime(fresh.get(field))
+
+    @staticmethod
+    def _info_text(assignment: Dict[str, Any]) -> str:
+        """Return the read-only ramp/load summary for an assignment."""
+        ramp = assignment.get('ramp', {})
+        load = assignment.get('load', {})
+        return (
+            f"Ramp: {ramp.get('code', 'N/A')} - {ramp.get('description', '')}\n"
+            f"Load: {load.get('reference', 'N/A')} ({load.get('direction', '')})"
+        )
+
     def _format_datetime(self, dt: Optional[str]) -> str:
         """Format datetime for input."""
         if not dt:
             return ""
+        if len(dt) < 10:
+            return dt
         try:
-            # Parse ISO format and return YYYY-MM-DD HH:MM
-            parsed = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-            return parsed.strftime("%Y-%m-%d %H:%M")
-        except:
-            return dt[:16] if len(dt) >= 16 else dt
+            # Parse ISO format (3.11+ accepts a trailing 'Z') and return YYYY-MM-DD HH:MM
+            parsed = datetime.fromisoformat(dt)
+        except ValueError:
+            return dt[:16]
+        return parsed.strftime("%Y-%m-%d %H:%M")
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -194,14 +229,15 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
         eta_in_input = self.query_one("#eta-in-input", Input)
         eta_out_input = self.query_one("#eta-out-input", Input)
 
-        status_id = status_select.value
         eta_in = eta_in_input.value.strip()
         eta_out = eta_out_input.value.strip()
 
         # Validate
-        if not status_id or status_id == Select.BLANK:
+        # Select.NULL is the unselected value (truthy, so it can't be tested with `not`)
+        if status_select.is_blank():
             error_msg.update("❌ Please select a status")
             return
+        status_id = status_select.value
 
         # Disable button
         save_button.disabled = True
@@ -209,12 +245,12 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
 
         try:
             # Parse dates
-            eta_in_dt = datetime.strptime(eta_in, "%Y-%m-%d %H:%M") if eta_in else None
-            eta_out_dt = datetime.strptime(eta_out, "%Y-%m-%d %H:%M") if eta_out else None
+            eta_in_dt = parse_local_datetime(eta_in) if eta_in else None
+            eta_out_dt = parse_local_datetime(eta_out) if eta_out else None
 
             # Prepare update data with version for optimistic locking
             data = {
-                "status_id": int(status_id),
+                "status_id": status_id,
                 "version": self.assignment['version'],
             }
 
@@ -228,13 +264,13 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
                 self.assignment['id'],
                 data
             )
-            logger.info(f"Updated assignment: {assignment['id']}")
+            logger.info("Updated assignment: %s", assignment['id'])
 
             # Success - close modal and return updated assignment
             self.dismiss(assignment)
 
         except ValueError as e:
-            error_msg.update(f"❌ Invalid date format. Use: YYYY-MM-DD HH:MM")
+            error_msg.update("❌ Invalid date. Use zero-padded YYYY-MM-DD HH:MM, e.g. 2025-01-05 09:30")
             save_button.disabled = False
             loading_msg.update("")
         except APIError as e:
@@ -246,7 +282,7 @@ class EditAssignmentModal(ModalScreen[Optional[Dict[str, Any]]]):
             save_button.disabled = False
             loading_msg.update("")
         except Exception as e:
-            logger.error(f"Error updating assignment: {e}", exc_info=True)
+            logger.error("Error updating assignment: %s", e, exc_info=True)
             error_msg.update(f"❌ Error: {str(e)[:50]}")
             save_button.disabled = False
             loading_msg.update("")
@@ -1,12 +1,11 @@
 """Ramp tile widget - displays a single ramp status."""
-from datetime import datetime
 from typing import Optional
 
 from textual.app import ComposeResult
 from textual.widgets import Static
 from textual.message import Message
 
-from app.services.ramp_status import RampInfo, RampStatus
+from app.services.ramp_status import RampInfo
 
 
 class RampTile(Static):
@@ -45,25 +44,8 @@ class RampTile(Static):
     def __init__(self, ramp_info: RampInfo) -> None:
         """Initialize ramp tile."""
         self.ramp_info = ramp_info
-
-        # Build display text
-        lines = []
-        lines.append(f"[bold]{self.ramp_info.ramp_code}[/bold]")
-        lines.append(self._get_status_display())
-
-        if self.ramp_info.is_occupied:
-            lines.append(f"{self.ramp_info.load_ref}")
-            if self.ramp_info.eta_out:
-                eta_str = self._format_eta(self.ramp_info.eta_out)
-                lines.append(f"Out: {eta_str}")
-        elif self.ramp_info.is_blocked:
-            notes = self.ramp_info.notes or "Blocked"
-            lines.append(f"{notes[:20]}")
-        else:
-            lines.append("Available")
-
-        content = "\n".join(lines)
-        super().__init__(content)
+        super().__init__(ramp_info.tile_content)
+        self._current_class: Optional[str] = None
         self._update_classes()
 
     def compose(self) -> ComposeResult:
@@ -71,40 +53,31 @@ class RampTile(Static):
         return []
 
     def _update_classes(self) -> None:
-        """Update CSS classes based on status."""
-        self.remove_class("free", "occupied", "blocked")
-
+        """Update CSS classes based on status (no-op when the class is unchanged)."""
         if self.ramp_info.is_free:
-            self.add_class("free")
+            new_class = "free"
         elif self.ramp_info.is_occupied:
-            self.add_class("occupied")
+            new_class = "occupied"
         elif self.ramp_info.is_blocked:
-            self.add_class("blocked")
+            new_class = "blocked"
+        else:
+            new_class = None
 
-    def _get_status_display(self) -> str:
-        """Get status display string."""
-        if self.ramp_info.is_free:
-            return "🟢 FREE"
-        elif self.ramp_info.is_occupied:
-            return "🔴 OCCUPIED"
-        elif self.ramp_info.is_blocked:
-            return "⚫ BLOCKED"
-        return "❓ UNKNOWN"
+        if new_class == self._current_class:
+            return
 
-    def _format_eta(self, eta: str) -> str:
-        """Format ETA for display."""
-        try:
-            dt = datetime.fromisoformat(eta.replace('Z', '+00:00'))
-            return dt.strftime("%H:%M")
-        except:
-            return eta[:16] if len(eta) >= 16 else eta
+        if self._current_class:
+            self.remove_class(self._current_class)
+        if new_class:
+            self.add_class(new_class)
+        self._current_class = new_class
 
     def update_ramp_info(self, ramp_info: RampInfo) -> None:
         """Update ramp information and refresh display."""
         self.ramp_info = ramp_info
         self._update_classes()
-        # Just refresh - don't remove/mount
-        self.refresh()
+        # Swap the cached content in place - don't remove/mount
+        self.update(ramp_info.tile_content)
 
     async def on_click(self) -> None:
         """Handle click on ramp tile."""
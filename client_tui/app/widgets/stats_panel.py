@@ -1,10 +1,14 @@
 """Statistics panel widget."""
-from typing import Any, Dict, List
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.widgets import Static
 
+# Shared read-only fallback for missing nested payloads; never mutate.
+_EMPTY: Dict[str, Any] = {}
+
 
 class StatsPanel(Static):
     """Panel displaying assignment statistics."""
@@ -46,6 +50,20 @@ class StatsPanel(Static):
         super().__init__(*args, **kwargs)
         self.assignments: List[Dict[str, Any]] = []
         self.total_ramps = 0
+        self.blocked = 0
+        self.overdue = 0
+
+        # Running counters, kept in sync by update_stats / apply_delta
+        self._total_assignments = 0
+        self._inbound = 0
+        self._status_counter: Counter[str] = Counter()
+        # Ramp id -> number of assignments on it (a ramp may hold several)
+        self._busy_ramps: Counter[int] = Counter()
+
+        # Debounce state: bursts of updates collapse into one render per refresh
+        self._pending: Optional[List[Dict[str, Any]]] = None
+        self._flush_scheduled = False
+        self._last_status_sig: Optional[Tuple[Tuple[str, int], ...]] = None
 
     def compose(self) -> ComposeResult:
         """Compose stats panel."""
@@ -63,32 +81,102 @@ class StatsPanel(Static):
         blocked: int = 0,
         overdue: int = 0,
     ) -> None:
-        """Update statistics."""
+        """
+        Recompute statistics from the full assignment list (bulk reload).
+
+        The recompute and render are deferred until after the next refresh, so
+        repeated calls within one frame only do the work once for the latest list.
+        """
         self.assignments = assignments
         self.total_ramps = total_ramps
+        self.blocked = blocked
+        self.overdue = overdue
+        self._pending = assignments
+        self._schedule_flush()
 
-        # Calculate stats
-        total_assignments = len(assignments)
-
-        # Count by direction
-        inbound = sum(1 for a in assignments if a.get("load", {}).get("direction") == "IB")
+    def apply_delta(
+        self,
+        old: Optional[Dict[str, Any]],
+        new: Optional[Dict[str, Any]],
+        *,
+        blocked: Optional[int] = None,
+        overdue: Optional[int] = None,
+    ) -> None:
+        """
+        Apply a single assignment change without rescanning all assignments.
+
+        Args:
+            old: Previous assignment payload (None when created)
+            new: Current assignment payload (None when deleted)
+            blocked: Updated blocked ramp count, if known
+            overdue: Updated overdue ramp count, if known
+        """
+        # A pending bulk reload is computed from the parent's live list, which
+        # already reflects this change.
+        if self._pending is None:
+            if old:
+                self._count(old, -1)
+            if new:
+                self._count(new, 1)
+        if blocked is not None:
+            self.blocked = blocked
+        if overdue is not None:
+            self.overdue = overdue
+
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Schedule a single trailing-edge render after the next refresh."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self.call_after_refresh(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Run the deferred recompute (if any) and render once."""
+        self._flush_scheduled = False
+        if self._pending is not None:
+            assignments, self._pending = self._pending, None
+            self._total_assignments = 0
+            self._inbound = 0
+            self._status_counter.clear()
+            self._busy_ramps.clear()
+            for assignment in assignments:
+                self._count(assignment, 1)
+
+        self._render_stats()
+
+    def _count(self, assignment: Dict[str, Any], step: int) -> None:
+        """Add (step=1) or remove (step=-1) an assignment's contribution."""
+        self._total_assignments += step
+
+        if (assignment.get("load") or _EMPTY).get("direction") == "IB":
+            self._inbound += step
+
+        status_label = (assignment.get("status") or _EMPTY).get("label", "Unknown")
+        self._status_counter[status_label] += step
+        if self._status_counter[status_label] <= 0:
+            del self._status_counter[status_label]
+
+        ramp_id = assignment.get("ramp_id")
+        if ramp_id:
+            self._busy_ramps[ramp_id] += step
+            if self._busy_ramps[ramp_id] <= 0:
+                del self._busy_ramps[ramp_id]
+
+    def _render_stats(self) -> None:
+        """Render the running counters into the stat sections."""
+        total_assignments = self._total_assignments
+        inbound = self._inbound
         outbound = total_assignments - inbound
-
-        # Count by status
-        status_counts: Dict[str, int] = {}
-        for a in assignments:
-            status_label = a.get("status", {}).get("label", "Unknown")
-            status_counts[status_label] = status_counts.get(status_label, 0) + 1
-
-        # Count busy ramps (unique ramps with assignments)
-        busy_ramps = len(set(a.get("ramp_id") for a in assignments if a.get("ramp_id")))
-        free_ramps = total_ramps - busy_ramps
+        busy_ramps = len(self._busy_ramps)
+        free_ramps = self.total_ramps - busy_ramps
 
         # Build stats text
         overview_lines = [
-            f"[white]Total ramps[/white] {total_ramps}",
+            f"[white]Total ramps[/white] {self.total_ramps}",
             f"[yellow]Busy[/yellow] {busy_ramps}   [green]Free[/green] {free_ramps}",
-            f"[red]Blocked[/red] {blocked}   [magenta]Overdue[/magenta] {overdue}",
+            f"[red]Blocked[/red] {self.blocked}   [magenta]Overdue[/magenta] {self.overdue}",
         ]
 
         assignments_lines = [
@@ -96,14 +184,20 @@ class StatsPanel(Static):
             f"[cyan]Inbound[/cyan] {inbound}   [yellow]Outbound[/yellow] {outbound}",
         ]
 
-        if status_counts:
+        self.query_one("#stats-overview", Static).update("\n".join(overview_lines))
+        self.query_one("#stats-assignments", Static).update("\n".join(assignments_lines))
+
+        # Skip the status section entirely when its ordering/counts are unchanged
+        status_sig = tuple(self._status_counter.most_common())
+        if status_sig == self._last_status_sig:
+            return
+        self._last_status_sig = status_sig
+
+        if status_sig:
             status_lines = ["[white]By status[/white]"]
-            sorted_statuses = sorted(status_counts.items(), key=lambda x: x[1], reverse=True)
-            status_lines.extend(f"• {label}: [white]{count}[/white]" for label, count in sorted_statuses)
+            status_lines.extend(f"• {label}: [white]{count}[/white]" for label, count in status_sig)
             status_text = "\n".join(status_lines)
         else:
             status_text = "No active assignments"
 
-        self.query_one("#stats-overview", Static).update("\n".join(overview_lines))
-        self.query_one("#stats-assignments", Static).update("\n".join(assignments_lines))
         self.query_one("#stats-status", Static).update(status_text)
@@ -36,6 +36,7 @@ a = Analysis(
         'textual',
         'httpx',
         'websockets',
+        'orjson',
         'pydantic',
         'rich',
         'markdown_it',
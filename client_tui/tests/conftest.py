@@ -1,203 +1,342 @@
-"""Pytest fixtures for TUI tests."""
-import asyncio
-from typing import Any, Callable, Dict, List
-from unittest.mock import AsyncMock, MagicMock, Mock
-
+"""
+Pytest fixtures for TUI tests.
+
+The sample data fixtures (test_token, test_user_data, test_ramps, test_loads,
+test_statuses, test_assignments) are session-scoped and built once; the same
+objects are shared by every test, so tests must treat them as read-only.
+Copy them (e.g. ``dict(test_user_data)``) before mutating.
+
+Session fixtures are built once per process, so under pytest-xdist each
+worker has its own copy and nothing is shared between workers.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import orjson
 import pytest
+
 from app.services.api_client import APIClient, APIError
 from app.services.websocket_client import WebSocketClient
 
+try:
+    import uvloop
+except ImportError:  # optional; only needed for --uvloop
+    uvloop = None
 
-# Mark all tests as asyncio by default
-pytestmark = pytest.mark.asyncio
 
+# Sample data, built once at import; fixtures below hand out these objects.
+# Record lists are tuples so a test can't append to or reorder shared data.
+Records = Tuple[Dict[str, Any], ...]
 
-@pytest.fixture
-def test_token() -> str:
-    """Return a sample JWT token for testing."""
-    return "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiIxIiwiZW1haWwiOiJhZG1pbkB0ZXN0LmNvbSIsInJvbGUiOiJBRE1JTiJ9.test"
+_TEST_TOKEN = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJzdWIiOiIxIiwiZW1haWwiOiJhZG1pbkB0ZXN0LmNvbSIsInJvbGUiOiJBRE1JTiJ9.test"
 
+_TEST_USER_DATA: Dict[str, Any] = {
+    "id": 1,
+    "email": "admin@test.com",
+    "full_name": "Admin User",
+    "role": "ADMIN",
+    "is_active": True,
+    "created_at": "2025-01-01T10:00:00",
+    "updated_at": "2025-01-01T10:00:00",
+    "version": 1,
+}
 
-@pytest.fixture
-def test_user_data() -> Dict[str, Any]:
-    """Return sample user data."""
-    return {
+_RAMPS: Records = (
+    {
         "id": 1,
-        "email": "admin@test.com",
-        "full_name": "Admin User",
-        "role": "ADMIN",
-        "is_active": True,
+        "code": "R1",
+        "description": "Ramp 1 Inbound",
+        "direction": "IB",
+        "type": "PRIME",
+        "version": 1,
         "created_at": "2025-01-01T10:00:00",
         "updated_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 2,
+        "code": "R2",
+        "description": "Ramp 2 Inbound",
+        "direction": "IB",
+        "type": "PRIME",
         "version": 1,
-    }
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 5,
+        "code": "R5",
+        "description": "Ramp 5 Outbound",
+        "direction": "OB",
+        "type": "PRIME",
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+)
 
+_LOADS: Records = (
+    {
+        "id": 1,
+        "reference": "LOAD001",
+        "direction": "IB",
+        "planned_arrival": "2025-01-05T14:00:00",
+        "planned_departure": None,
+        "notes": "Test inbound load",
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 2,
+        "reference": "LOAD002",
+        "direction": "OB",
+        "planned_arrival": None,
+        "planned_departure": "2025-01-05T16:00:00",
+        "notes": "Test outbound load",
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+)
 
-@pytest.fixture
-def test_ramps() -> List[Dict[str, Any]]:
+_STATUSES: Records = (
+    {
+        "id": 1,
+        "code": "PENDING",
+        "label": "Pending",
+        "color": "yellow",
+        "sort_order": 1,
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 2,
+        "code": "ARRIVED",
+        "label": "Arrived",
+        "color": "blue",
+        "sort_order": 2,
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+    {
+        "id": 3,
+        "code": "COMPLETED",
+        "label": "Completed",
+        "color": "green",
+        "sort_order": 3,
+        "version": 1,
+        "created_at": "2025-01-01T10:00:00",
+        "updated_at": "2025-01-01T10:00:00",
+    },
+)
+
+_ASSIGNMENTS: Records = (
+    {
+        "id": 1,
+        "ramp_id": 1,
+        "load_id": 1,
+        "status_id": 1,
+        "eta_in": "2025-01-05T14:00:00",
+        "eta_out": "2025-01-05T16:00:00",
+        "created_by": 1,
+        "updated_by": 1,
+        "version": 1,
+        "created_at": "2025-01-05T10:00:00",
+        "updated_at": "2025-01-05T10:00:00",
+        "ramp": _RAMPS[0],
+        "load": _LOADS[0],
+        "status": _STATUSES[0],
+        "creator": _TEST_USER_DATA,
+        "updater": _TEST_USER_DATA,
+    },
+    {
+        "id": 2,
+        "ramp_id": 5,
+        "load_id": 2,
+        "status_id": 2,
+        "eta_in": None,
+        "eta_out": "2025-01-05T16:00:00",
+        "created_by": 1,
+        "updated_by": 1,
+        "version": 1,
+        "created_at": "2025-01-05T10:00:00",
+        "updated_at": "2025-01-05T10:00:00",
+        "ramp": _RAMPS[2],
+        "load": _LOADS[1],
+        "status": _STATUSES[1],
+        "creator": _TEST_USER_DATA,
+        "updater": _TEST_USER_DATA,
+    },
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register conftest command line options."""
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        default=False,
+        help="Run async tests on uvloop instead of the default asyncio loop.",
+    )
+
+
+class _UvloopPlugin:
+    """Loop factory hook, registered only when --uvloop is given."""
+
+    def pytest_asyncio_loop_factories(
+        self, config: pytest.Config, item: pytest.Item
+    ) -> Dict[str, Callable[[], Any]]:
+        """Run async tests on uvloop; the session loop is created once per worker."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Opt in to uvloop; by default tests use the standard asyncio loop."""
+    if not config.getoption("uvloop"):
+        return
+    if uvloop is None:
+        raise pytest.UsageError("--uvloop requires the uvloop package")
+    config.pluginmanager.register(_UvloopPlugin(), "rampforge-uvloop")
+
+
+async def _instant_sleep(*_args: Any, **_kwargs: Any) -> None:
+    """Stand-in for asyncio.sleep that returns without suspending."""
+    return None
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(request: pytest.FixtureRequest) -> Iterator[None]:
+    """
+    Make asyncio.sleep return immediately so retry/backoff paths don't idle.
+
+    Opt out with ``@pytest.mark.real_sleep``.
+    """
+    if request.node.get_closest_marker("real_sleep"):
+        yield
+        return
+    with patch("asyncio.sleep", new=_instant_sleep):
+        yield
+
+
+@pytest.fixture(scope="session")
+def test_token() -> str:
+    """Return a sample JWT token for testing."""
+    return _TEST_TOKEN
+
+
+@pytest.fixture(scope="session")
+def test_user_data() -> Dict[str, Any]:
+    """Return sample user data."""
+    return _TEST_USER_DATA
+
+
+@pytest.fixture(scope="session")
+def test_ramps() -> Records:
     """Return sample ramps data."""
-    return [
-        {
-            "id": 1,
-            "code": "R1",
-            "description": "Ramp 1 Inbound",
-            "direction": "IB",
-            "type": "PRIME",
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-        {
-            "id": 2,
-            "code": "R2",
-            "description": "Ramp 2 Inbound",
-            "direction": "IB",
-            "type": "PRIME",
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-        {
-            "id": 5,
-            "code": "R5",
-            "description": "Ramp 5 Outbound",
-            "direction": "OB",
-            "type": "PRIME",
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-    ]
+    return _RAMPS
 
 
-@pytest.fixture
-def test_loads() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def test_loads() -> Records:
     """Return sample loads data."""
-    return [
-        {
-            "id": 1,
-            "reference": "LOAD001",
-            "direction": "IB",
-            "planned_arrival": "2025-01-05T14:00:00",
-            "planned_departure": None,
-            "notes": "Test inbound load",
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-        {
-            "id": 2,
-            "reference": "LOAD002",
-            "direction": "OB",
-            "planned_arrival": None,
-            "planned_departure": "2025-01-05T16:00:00",
-            "notes": "Test outbound load",
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-    ]
+    return _LOADS
 
 
-@pytest.fixture
-def test_statuses() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def ib_loads(test_loads: Records) -> Records:
+    """Return the inbound sample loads."""
+    return tuple(load for load in test_loads if load["direction"] == "IB")
+
+
+@pytest.fixture(scope="session")
+def test_statuses() -> Records:
     """Return sample statuses data."""
-    return [
-        {
-            "id": 1,
-            "code": "PENDING",
-            "label": "Pending",
-            "color": "yellow",
-            "sort_order": 1,
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-        {
-            "id": 2,
-            "code": "ARRIVED",
-            "label": "Arrived",
-            "color": "blue",
-            "sort_order": 2,
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-        {
-            "id": 3,
-            "code": "COMPLETED",
-            "label": "Completed",
-            "color": "green",
-            "sort_order": 3,
-            "version": 1,
-            "created_at": "2025-01-01T10:00:00",
-            "updated_at": "2025-01-01T10:00:00",
-        },
-    ]
+    return _STATUSES
 
 
-@pytest.fixture
-def test_assignments(
-    test_ramps: List[Dict[str, Any]],
-    test_loads: List[Dict[str, Any]],
-    test_statuses: List[Dict[str, Any]],
-    test_user_data: Dict[str, Any],
-) -> List[Dict[str, Any]]:
+@pytest.fixture(scope="session")
+def test_assignments() -> Records:
     """Return sample assignments data."""
-    return [
-        {
-            "id": 1,
-            "ramp_id": 1,
-            "load_id": 1,
-            "status_id": 1,
-            "eta_in": "2025-01-05T14:00:00",
-            "eta_out": "2025-01-05T16:00:00",
-            "created_by": 1,
-            "updated_by": 1,
-            "version": 1,
-            "created_at": "2025-01-05T10:00:00",
-            "updated_at": "2025-01-05T10:00:00",
-            "ramp": test_ramps[0],
-            "load": test_loads[0],
-            "status": test_statuses[0],
-            "creator": test_user_data,
-            "updater": test_user_data,
-        },
-        {
-            "id": 2,
-            "ramp_id": 5,
-            "load_id": 2,
-            "status_id": 2,
-            "eta_in": None,
-            "eta_out": "2025-01-05T16:00:00",
-            "created_by": 1,
-            "updated_by": 1,
-            "version": 1,
-            "created_at": "2025-01-05T10:00:00",
-            "updated_at": "2025-01-05T10:00:00",
-            "ramp": test_ramps[2],
-            "load": test_loads[1],
-            "status": test_statuses[1],
-            "creator": test_user_data,
-            "updater": test_user_data,
-        },
-    ]
+    return _ASSIGNMENTS
+
+
+@pytest.fixture(scope="session")
+def _assignments_by_direction(
+    test_assignments: Records,
+) -> Dict[Optional[str], Records]:
+    """Sample assignments pre-filtered per direction (None means unfiltered)."""
+    by_direction: Dict[Optional[str], Records] = {None: test_assignments}
+    for direction in ("IB", "OB"):
+        by_direction[direction] = tuple(
+            a for a in test_assignments if a["ramp"]["direction"] == direction
+        )
+    return by_direction
+
+
+@pytest.fixture(params=[None, "IB", "OB"])
+def assignment_direction(request: pytest.FixtureRequest) -> Optional[str]:
+    """Direction filter to run a test with: unfiltered, IB and OB."""
+    return request.param
 
 
 @pytest.fixture
-def mock_api_client(
+def assignments_for_direction(
+    assignment_direction: Optional[str],
+    _assignments_by_direction: Dict[Optional[str], Records],
+) -> Records:
+    """Return the sample assignments matching assignment_direction."""
+    return _assignments_by_direction[assignment_direction]
+
+
+@pytest.fixture(scope="module")
+def _mock_api_client(
     test_token: str,
     test_user_data: Dict[str, Any],
-    test_assignments: List[Dict[str, Any]],
-    test_ramps: List[Dict[str, Any]],
-    test_loads: List[Dict[str, Any]],
-    test_statuses: List[Dict[str, Any]],
+    test_assignments: Records,
+    _assignments_by_direction: Dict[Optional[str], Records],
+    test_ramps: Records,
+    test_loads: Records,
+    test_statuses: Records,
 ) -> APIClient:
-    """Return mocked APIClient with preset responses."""
+    """Build the mocked APIClient once per module (see mock_api_client)."""
     client = APIClient()
     client.token = test_token
     client.user_data = test_user_data
 
+    # Lookup tables so the mocks below don't rescan the sample data per call
+    loads_by_dir = {
+        d: tuple(load for load in test_loads if load["direction"] == d) for d in ("IB", "OB")
+    }
+    assignments_by_id = {a["id"]: a for a in test_assignments}
+
+    # Server-assigned fields for the create mocks; these win over request data
+    created_fields = {
+        "version": 1,
+        "created_at": "2025-01-05T12:00:00",
+        "updated_at": "2025-01-05T12:00:00",
+    }
+    new_assignment_fields = {
+        **created_fields,
+        "created_by": 1,
+        "updated_by": 1,
+        "ramp": test_ramps[0],
+        "load": test_loads[0],
+        "status": test_statuses[0],
+        "creator": test_user_data,
+        "updater": test_user_data,
+    }
+    new_user_fields = {"is_active": True, **created_fields}
+
+    def _created(data: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+        out = {"id": 99}
+        out.update(data)
+        out.update(fields)
+        return out
+
     # Mock login
     async def mock_login(email: str, password: str) -> Dict[str, Any]:
         if email == "admin@test.com" and password == "admin123":
@@ -209,39 +348,23 @@ def mock_api_client(
     client.login = mock_login  # type: ignore
 
     # Mock get_assignments
-    async def mock_get_assignments(direction: str | None = None) -> List[Dict[str, Any]]:
-        if direction:
-            return [a for a in test_assignments if a["ramp"]["direction"] == direction]
-        return test_assignments
+    async def mock_get_assignments(direction: str | None = None) -> Sequence[Dict[str, Any]]:
+        return _assignments_by_direction.get(direction or None, ())
 
     client.get_assignments = mock_get_assignments  # type: ignore
 
     # Mock get_assignment
     async def mock_get_assignment(assignment_id: int) -> Dict[str, Any]:
-        for assignment in test_assignments:
-            if assignment["id"] == assignment_id:
-                return assignment
-        raise APIError(404, "Assignment not found")
+        assignment = assignments_by_id.get(assignment_id)
+        if assignment is None:
+            raise APIError(404, "Assignment not found")
+        return assignment
 
     client.get_assignment = mock_get_assignment  # type: ignore
 
     # Mock create_assignment
     async def mock_create_assignment(data: Dict[str, Any]) -> Dict[str, Any]:
-        new_assignment = {
-            "id": 99,
-            **data,
-            "version": 1,
-            "created_at": "2025-01-05T12:00:00",
-            "updated_at": "2025-01-05T12:00:00",
-            "created_by": 1,
-            "updated_by": 1,
-            "ramp": test_ramps[0],
-            "load": test_loads[0],
-            "status": test_statuses[0],
-            "creator": test_user_data,
-            "updater": test_user_data,
-        }
-        return new_assignment
+        return _created(data, new_assignment_fields)
 
     client.create_assignment = mock_create_assignment  # type: ignore
 
@@ -249,42 +372,39 @@ def mock_api_client(
     async def mock_update_assignment(
         assignment_id: int, data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        for assignment in test_assignments:
-            if assignment["id"] == assignment_id:
-                # Check version conflict
-                if "version" in data and data["version"] != assignment["version"]:
-                    raise APIError(409, "Version conflict")
-                updated = {**assignment, **data, "version": assignment["version"] + 1}
-                return updated
-        raise APIError(404, "Assignment not found")
+        assignment = assignments_by_id.get(assignment_id)
+        if assignment is None:
+            raise APIError(404, "Assignment not found")
+        # Check version conflict
+        if "version" in data and data["version"] != assignment["version"]:
+            raise APIError(409, "Version conflict")
+        return {**assignment, **data, "version": assignment["version"] + 1}
 
     client.update_assignment = mock_update_assignment  # type: ignore
 
     # Mock delete_assignment
     async def mock_delete_assignment(assignment_id: int) -> None:
-        for assignment in test_assignments:
-            if assignment["id"] == assignment_id:
-                return
-        raise APIError(404, "Assignment not found")
+        if assignment_id not in assignments_by_id:
+            raise APIError(404, "Assignment not found")
 
     client.delete_assignment = mock_delete_assignment  # type: ignore
 
     # Mock get_ramps
-    async def mock_get_ramps() -> List[Dict[str, Any]]:
+    async def mock_get_ramps() -> Sequence[Dict[str, Any]]:
         return test_ramps
 
     client.get_ramps = mock_get_ramps  # type: ignore
 
     # Mock get_loads
-    async def mock_get_loads(direction: str | None = None) -> List[Dict[str, Any]]:
+    async def mock_get_loads(direction: str | None = None) -> Sequence[Dict[str, Any]]:
         if direction:
-            return [l for l in test_loads if l["direction"] == direction]
+            return loads_by_dir.get(direction, ())
         return test_loads
 
     client.get_loads = mock_get_loads  # type: ignore
 
     # Mock get_statuses
-    async def mock_get_statuses() -> List[Dict[str, Any]]:
+    async def mock_get_statuses() -> Sequence[Dict[str, Any]]:
         return test_statuses
 
     client.get_statuses = mock_get_statuses  # type: ignore
@@ -297,38 +417,19 @@ def mock_api_client(
 
     # Mock create_load
     async def mock_create_load(data: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "id": 99,
-            **data,
-            "version": 1,
-            "created_at": "2025-01-05T12:00:00",
-            "updated_at": "2025-01-05T12:00:00",
-        }
+        return _created(data, created_fields)
 
     client.create_load = mock_create_load  # type: ignore
 
     # Mock create_ramp
     async def mock_create_ramp(data: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "id": 99,
-            **data,
-            "version": 1,
-            "created_at": "2025-01-05T12:00:00",
-            "updated_at": "2025-01-05T12:00:00",
-        }
+        return _created(data, created_fields)
 
     client.create_ramp = mock_create_ramp  # type: ignore
 
     # Mock create_user
     async def mock_create_user(data: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "id": 99,
-            **data,
-            "is_active": True,
-            "version": 1,
-            "created_at": "2025-01-05T12:00:00",
-            "updated_at": "2025-01-05T12:00:00",
-        }
+        return _created(data, new_user_fields)
 
     client.create_user = mock_create_user  # type: ignore
 
@@ -336,73 +437,166 @@ def mock_api_client(
 
 
 @pytest.fixture
-def mock_websocket_client(test_token: str) -> WebSocketClient:
-    """Return mocked WebSocketClient."""
-    ws_client = WebSocketClient()
-    ws_client.token = test_token
-    ws_client.running = False
-
-    # Mock websocket connection
-    mock_ws = MagicMock()
-    mock_ws.send = AsyncMock()
-    mock_ws.close = AsyncMock()
-    ws_client.websocket = mock_ws
-
-    # Mock connect
-    async def mock_connect() -> None:
-        ws_client.running = True
-
-    ws_client.connect = mock_connect  # type: ignore
-
-    # Mock subscribe
-    async def mock_subscribe(direction: str | None = None) -> None:
-        message = {"type": "subscribe"}
-        if direction:
-            message["filters"] = {"direction": direction}
-        # No-op for tests
+def mock_api_client(
+    _mock_api_client: APIClient, test_token: str, test_user_data: Dict[str, Any]
+) -> APIClient:
+    """Return mocked APIClient with preset responses and a fresh session."""
+    _mock_api_client.token = test_token
+    _mock_api_client.user_data = test_user_data
+    return _mock_api_client
 
-    ws_client.subscribe = mock_subscribe  # type: ignore
 
-    # Mock unsubscribe
-    async def mock_unsubscribe() -> None:
-        # No-op for tests
-        pass
+@pytest.fixture
+def mock_ws() -> AsyncMock:
+    """Return a bare AsyncMock standing in for an open websocket connection."""
+    return AsyncMock()
 
-    ws_client.unsubscribe = mock_unsubscribe  # type: ignore
 
-    # Mock ping
-    async def mock_ping() -> None:
-        # No-op for tests
-        pass
+@pytest.fixture
+def ws_client(test_token: str, mock_ws: AsyncMock) -> WebSocketClient:
+    """
+    Return a real WebSocketClient with a token set and mock_ws as its socket.
+
+    Tests that need a different socket (e.g. an async-iterable MagicMock for
+    _listen) just assign client.websocket themselves.
+    """
+    client = WebSocketClient()
+    client.set_token(test_token)
+    client.websocket = mock_ws
+    return client
 
-    ws_client.ping = mock_ping  # type: ignore
 
-    # Mock disconnect
-    async def mock_disconnect() -> None:
-        ws_client.running = False
+async def _unexpected_request(*args: Any, **kwargs: Any) -> Any:
+    raise AssertionError("HTTP request not stubbed by the test")
 
-    ws_client.disconnect = mock_disconnect  # type: ignore
 
-    return ws_client
+class FakeAsyncClient:
+    """
+    Stand-in for httpx.AsyncClient handed to APIClient via client_factory.
 
+    ``async with`` yields the instance itself; tests assign get/post/patch/
+    delete (e.g. ``fake.get = async_return(resp)``). Unstubbed methods fail
+    the test instead of touching the network.
+    """
 
-@pytest.fixture
-def mock_httpx_response():
-    """Factory for creating mock httpx responses."""
+    def __init__(self) -> None:
+        self.get: Callable[..., Any] = _unexpected_request
+        self.post: Callable[..., Any] = _unexpected_request
+        self.patch: Callable[..., Any] = _unexpected_request
+        self.delete: Callable[..., Any] = _unexpected_request
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "FakeAsyncClient":
+        # Used as the factory itself: every request gets this instance
+        return self
+
+    async def __aenter__(self) -> "FakeAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def httpx_stub(monkeypatch: pytest.MonkeyPatch) -> FakeAsyncClient:
+    """
+    Return the fake HTTP client injected into api_client/authed_client.
+
+    Autouse: httpx.AsyncClient is patched to return it for every test, so
+    no APIClient, however it was built, can reach the network.
+    """
+    fake = FakeAsyncClient()
+    monkeypatch.setattr(httpx, "AsyncClient", fake)
+    return fake
 
-    def create_response(status_code: int, json_data: Any = None, text: str = "") -> Mock:
-        response = Mock()
-        response.status_code = status_code
-        response.json = Mock(return_value=json_data or {})
-        response.text = text
-        return response
 
-    return create_response
+@pytest.fixture
+def api_client(httpx_stub: FakeAsyncClient) -> APIClient:
+    """Return an unauthenticated APIClient wired to httpx_stub."""
+    return APIClient(client_factory=httpx_stub)
 
 
 @pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def authed_client(api_client: APIClient) -> APIClient:
+    """Return an APIClient wired to httpx_stub that already holds a token."""
+    api_client.token = "test_token"
+    return api_client
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Minimal stand-in for httpx.Response (what APIClient reads)."""
+
+    status_code: int
+    body: Any = None
+    text: str = ""
+    content: bytes = b""
+
+    def json(self) -> Any:
+        return self.body
+
+
+def _async_return(value: Any) -> Callable[..., Any]:
+    """Build a coroutine function that ignores its arguments and returns value."""
+
+    async def _ret(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _ret
+
+
+def _async_raise(exc: BaseException) -> Callable[..., Any]:
+    """Build a coroutine function that ignores its arguments and raises exc."""
+
+    async def _raise(*args: Any, **kwargs: Any) -> Any:
+        raise exc
+
+    return _raise
+
+
+@pytest.fixture(scope="session")
+def async_return() -> Callable[[Any], Callable[..., Any]]:
+    """
+    Factory for canned async methods, e.g. ``httpx_stub.get = async_return(resp)``.
+
+    Cheaper than AsyncMock(return_value=...); use AsyncMock only when the
+    test asserts on calls.
+    """
+    return _async_return
+
+
+@pytest.fixture(scope="session")
+def async_raise() -> Callable[[BaseException], Callable[..., Any]]:
+    """Factory for failing async methods; the async_return counterpart of side_effect."""
+    return _async_raise
+
+
+# (status_code, id(json_data), text) -> (json_data, response). The payload is
+# kept alongside the response so its id can't be recycled while cached.
+_response_cache: Dict[Tuple[int, int, str], Tuple[Any, FakeResponse]] = {}
+
+
+def _create_response(status_code: int, json_data: Any = None, text: str = "") -> FakeResponse:
+    """Build (or reuse) a fake response; payloads must not be mutated afterwards."""
+    key = (status_code, id(json_data), text)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        return cached[1]
+    body = json_data or {}
+    # Encode once; like httpx, text defaults to the decoded body
+    content = orjson.dumps(body)
+    response = FakeResponse(status_code, body, text or content.decode(), content)
+    _response_cache[key] = (json_data, response)
+    return response
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _clear_response_cache() -> Iterator[None]:
+    """Drop cached fake responses at the end of the session."""
+    yield
+    _response_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def mock_httpx_response() -> Callable[..., FakeResponse]:
+    """Factory for creating mock httpx responses (memoized per payload)."""
+    return _create_response
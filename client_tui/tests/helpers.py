@@ -0,0 +1,45 @@
+"""Shared test doubles for the websocket tests."""
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+import websockets
+
+
+class FakeWS:
+    """Minimal websocket stand-in that records sent frames without Mock overhead."""
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+        self.closed = False
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class ClosedWS(FakeWS):
+    """FakeWS whose socket has gone away: every send raises ConnectionClosed."""
+
+    async def send(self, message: str) -> None:
+        raise websockets.exceptions.ConnectionClosed(None, None)
+
+
+class AsyncStream:
+    """Async-iterable websocket stand-in: yields messages, then optionally raises."""
+
+    def __init__(self, messages: Iterable[Any], exc: Optional[BaseException] = None) -> None:
+        self.messages = list(messages)
+        self.exc = exc
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[Any]:
+        for message in self.messages:
+            yield message
+        if self.exc is not None:
+            raise self.exc
+
+    async def close(self) -> None:
+        return None
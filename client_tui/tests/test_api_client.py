@@ -1,186 +1,140 @@
 """Tests for APIClient."""
-from typing import Any, Dict, List
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock
 
 import pytest
 from app.services.api_client import APIClient, APIError
 
 
-pytestmark = pytest.mark.asyncio
-
-
 class TestAPIClientLogin:
     """Test login functionality."""
 
     async def test_login_success(
-        self, mock_httpx_response, test_token: str, test_user_data: Dict[str, Any]
+        self,
+        api_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_token: str,
+        test_user_data: Dict[str, Any],
     ):
         """Test successful login returns user data and sets token."""
-        client = APIClient()
-
         # Mock login response
         login_response = mock_httpx_response(
             200, {"access_token": test_token, "token_type": "bearer"}
         )
         # Mock user info response
         user_response = mock_httpx_response(200, test_user_data)
+        httpx_stub.post = async_return(login_response)
+        httpx_stub.get = async_return(user_response)
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=login_response)
-            mock_context.get = AsyncMock(return_value=user_response)
-
-            result = await client.login("admin@test.com", "admin123")
-
-            assert result == test_user_data
-            assert client.token == test_token
-            assert client.user_data == test_user_data
-
-    async def test_login_invalid_credentials(self, mock_httpx_response):
-        """Test login with invalid credentials raises APIError."""
-        client = APIClient()
-
-        # Mock 401 response
-        response = mock_httpx_response(401, {"detail": "Invalid credentials"})
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
-
-            with pytest.raises(APIError) as exc_info:
-                await client.login("wrong@test.com", "wrongpass")
-
-            assert exc_info.value.status_code == 401
-            assert "Invalid credentials" in exc_info.value.detail
-
-    async def test_login_server_error(self, mock_httpx_response):
-        """Test login with server error raises APIError."""
-        client = APIClient()
-
-        # Mock 500 response
-        response = mock_httpx_response(500, {"detail": "Internal server error"})
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
-
-            with pytest.raises(APIError) as exc_info:
-                await client.login("admin@test.com", "admin123")
+        result = await api_client.login("admin@test.com", "admin123")
 
-            assert exc_info.value.status_code == 500
+        assert result is test_user_data
+        assert api_client.token == test_token
+        assert api_client.user_data is test_user_data
 
-    async def test_login_connection_error(self):
+    async def test_login_connection_error(self, api_client, httpx_stub, async_raise):
         """Test login with connection error raises exception."""
-        client = APIClient()
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(side_effect=Exception("Connection failed"))
+        httpx_stub.post = async_raise(Exception("Connection failed"))
 
-            with pytest.raises(Exception) as exc_info:
-                await client.login("admin@test.com", "admin123")
+        with pytest.raises(Exception) as exc_info:
+            await api_client.login("admin@test.com", "admin123")
 
-            assert "Connection failed" in str(exc_info.value)
+        assert "Connection failed" in str(exc_info.value)
 
 
 class TestAPIClientAssignments:
     """Test assignments API methods."""
 
     async def test_get_assignments_all(
-        self, mock_httpx_response, test_assignments: List[Dict[str, Any]]
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_assignments: List[Dict[str, Any]],
     ):
         """Test fetching all assignments."""
-        client = APIClient()
-        client.token = "test_token"
+        httpx_stub.get = async_return(mock_httpx_response(200, test_assignments))
 
-        response = mock_httpx_response(200, test_assignments)
+        result = await authed_client.get_assignments()
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
-
-            result = await client.get_assignments()
-
-            assert len(result) == 2
-            assert result == test_assignments
+        assert len(result) == 2
+        assert result is test_assignments
 
     async def test_get_assignments_filtered_by_direction(
-        self, mock_httpx_response, test_assignments: List[Dict[str, Any]]
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        assignment_direction: Optional[str],
+        assignments_for_direction: List[Dict[str, Any]],
     ):
         """Test fetching assignments filtered by direction."""
-        client = APIClient()
-        client.token = "test_token"
+        httpx_stub.get = AsyncMock(
+            return_value=mock_httpx_response(200, assignments_for_direction)
+        )
 
-        # Filter for IB assignments
-        ib_assignments = [a for a in test_assignments if a["ramp"]["direction"] == "IB"]
-        response = mock_httpx_response(200, ib_assignments)
+        result = await authed_client.get_assignments(direction=assignment_direction)
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        expected_params = {"direction": assignment_direction} if assignment_direction else {}
+        assert httpx_stub.get.call_args.kwargs["params"] == expected_params
+        assert result is assignments_for_direction
+        if assignment_direction:
+            assert all(a["ramp"]["direction"] == assignment_direction for a in result)
 
-            result = await client.get_assignments(direction="IB")
+    async def test_get_assignments_uses_client_factory(
+        self,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_assignments: List[Dict[str, Any]],
+    ):
+        """Test requests build their HTTP client through the injected factory."""
+        factory_calls = []
 
-            assert len(result) == 1
-            assert result[0]["ramp"]["direction"] == "IB"
+        def client_factory(**kwargs):
+            factory_calls.append(kwargs)
+            return httpx_stub
 
-    async def test_get_assignments_not_authenticated(self):
-        """Test get_assignments without token raises APIError."""
-        client = APIClient()
+        client = APIClient(client_factory=client_factory)
+        client.token = "test_token"
+        httpx_stub.get = async_return(mock_httpx_response(200, test_assignments))
+
+        result = await client.get_assignments()
 
+        assert result is test_assignments
+        assert factory_calls == [{"timeout": 30.0}]
+
+    async def test_get_assignments_not_authenticated(self, api_client):
+        """Test get_assignments without token raises APIError."""
         with pytest.raises(APIError) as exc_info:
-            await client.get_assignments()
+            await api_client.get_assignments()
 
         assert exc_info.value.status_code == 401
         assert "Not authenticated" in exc_info.value.detail
 
     async def test_get_assignment_by_id(
-        self, mock_httpx_response, test_assignments: List[Dict[str, Any]]
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_assignments: List[Dict[str, Any]],
     ):
         """Test fetching single assignment by ID."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(200, test_assignments[0])
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
-
-            result = await client.get_assignment(1)
-
-            assert result["id"] == 1
-            assert result == test_assignments[0]
-
-    async def test_get_assignment_not_found(self, mock_httpx_response):
-        """Test get_assignment with invalid ID raises APIError."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(404, None, "Assignment not found")
+        httpx_stub.get = async_return(mock_httpx_response(200, test_assignments[0]))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        result = await authed_client.get_assignment(1)
 
-            with pytest.raises(APIError) as exc_info:
-                await client.get_assignment(999)
+        assert result["id"] == 1
+        assert result is test_assignments[0]
 
-            assert exc_info.value.status_code == 404
-
-    async def test_create_assignment(self, mock_httpx_response):
+    async def test_create_assignment(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test creating new assignment."""
-        client = APIClient()
-        client.token = "test_token"
-
         assignment_data = {
             "ramp_id": 1,
             "load_id": 1,
@@ -193,213 +147,124 @@ class TestAPIClientAssignments:
             "version": 1,
         }
 
-        response = mock_httpx_response(201, created_assignment)
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
+        httpx_stub.post = async_return(mock_httpx_response(201, created_assignment))
 
-            result = await client.create_assignment(assignment_data)
+        result = await authed_client.create_assignment(assignment_data)
 
-            assert result["id"] == 99
-            assert result["ramp_id"] == 1
+        assert result["id"] == 99
+        assert result["ramp_id"] == 1
 
-    async def test_create_assignment_invalid_data(self, mock_httpx_response):
-        """Test create_assignment with invalid data raises APIError."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(422, {"detail": "Validation error"})
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
-
-            with pytest.raises(APIError) as exc_info:
-                await client.create_assignment({})
-
-            assert exc_info.value.status_code == 422
-
-    async def test_update_assignment(self, mock_httpx_response):
+    async def test_update_assignment(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test updating existing assignment."""
-        client = APIClient()
-        client.token = "test_token"
-
         update_data = {"status_id": 2, "version": 1}
         updated_assignment = {"id": 1, "status_id": 2, "version": 2}
 
-        response = mock_httpx_response(200, updated_assignment)
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.patch = AsyncMock(return_value=response)
-
-            result = await client.update_assignment(1, update_data)
-
-            assert result["version"] == 2
-            assert result["status_id"] == 2
-
-    async def test_update_assignment_version_conflict(self, mock_httpx_response):
-        """Test update_assignment with version conflict raises APIError 409."""
-        client = APIClient()
-        client.token = "test_token"
-
-        conflict_response = mock_httpx_response(
-            409,
-            {
-                "detail": {
-                    "detail": "Version conflict",
-                    "current_version": 3,
-                    "provided_version": 1,
-                }
-            },
-        )
+        httpx_stub.patch = async_return(mock_httpx_response(200, updated_assignment))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.patch = AsyncMock(return_value=conflict_response)
+        result = await authed_client.update_assignment(1, update_data)
 
-            with pytest.raises(APIError) as exc_info:
-                await client.update_assignment(1, {"status_id": 2, "version": 1})
+        assert result["version"] == 2
+        assert result["status_id"] == 2
 
-            assert exc_info.value.status_code == 409
-            assert "Version conflict" in exc_info.value.detail
-
-    async def test_delete_assignment(self, mock_httpx_response):
+    async def test_delete_assignment(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test deleting assignment."""
-        client = APIClient()
-        client.token = "test_token"
+        httpx_stub.delete = async_return(mock_httpx_response(204))
 
-        response = mock_httpx_response(204)
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.delete = AsyncMock(return_value=response)
-
-            await client.delete_assignment(1)
-            # Should not raise any exception
-
-    async def test_delete_assignment_not_found(self, mock_httpx_response):
-        """Test delete_assignment with invalid ID raises APIError."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(404, None, "Assignment not found")
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.delete = AsyncMock(return_value=response)
-
-            with pytest.raises(APIError) as exc_info:
-                await client.delete_assignment(999)
-
-            assert exc_info.value.status_code == 404
+        await authed_client.delete_assignment(1)
+        # Should not raise any exception
 
 
 class TestAPIClientOtherEndpoints:
     """Test other API endpoints."""
 
-    async def test_get_ramps(self, mock_httpx_response, test_ramps: List[Dict[str, Any]]):
+    async def test_get_ramps(
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_ramps: List[Dict[str, Any]],
+    ):
         """Test fetching all ramps."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(200, test_ramps)
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        httpx_stub.get = async_return(mock_httpx_response(200, test_ramps))
 
-            result = await client.get_ramps()
+        result = await authed_client.get_ramps()
 
-            assert len(result) == 3
-            assert result == test_ramps
+        assert len(result) == 3
+        assert result is test_ramps
 
-    async def test_get_loads(self, mock_httpx_response, test_loads: List[Dict[str, Any]]):
+    async def test_get_loads(
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_loads: List[Dict[str, Any]],
+    ):
         """Test fetching all loads."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(200, test_loads)
+        httpx_stub.get = async_return(mock_httpx_response(200, test_loads))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        result = await authed_client.get_loads()
 
-            result = await client.get_loads()
-
-            assert len(result) == 2
-            assert result == test_loads
+        assert len(result) == 2
+        assert result is test_loads
 
     async def test_get_loads_filtered(
-        self, mock_httpx_response, test_loads: List[Dict[str, Any]]
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        ib_loads: List[Dict[str, Any]],
     ):
         """Test fetching loads filtered by direction."""
-        client = APIClient()
-        client.token = "test_token"
-
-        ib_loads = [l for l in test_loads if l["direction"] == "IB"]
-        response = mock_httpx_response(200, ib_loads)
+        httpx_stub.get = async_return(mock_httpx_response(200, ib_loads))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        result = await authed_client.get_loads(direction="IB")
 
-            result = await client.get_loads(direction="IB")
-
-            assert len(result) == 1
-            assert result[0]["direction"] == "IB"
+        assert len(result) == 1
+        assert result[0]["direction"] == "IB"
 
     async def test_get_statuses(
-        self, mock_httpx_response, test_statuses: List[Dict[str, Any]]
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_statuses: List[Dict[str, Any]],
     ):
         """Test fetching all statuses."""
-        client = APIClient()
-        client.token = "test_token"
-
-        response = mock_httpx_response(200, test_statuses)
+        httpx_stub.get = async_return(mock_httpx_response(200, test_statuses))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        result = await authed_client.get_statuses()
 
-            result = await client.get_statuses()
+        assert len(result) == 3
+        assert result is test_statuses
 
-            assert len(result) == 3
-            assert result == test_statuses
-
-    async def test_get_users(self, mock_httpx_response, test_user_data: Dict[str, Any]):
+    async def test_get_users(
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        test_user_data: Dict[str, Any],
+    ):
         """Test fetching all users (admin only)."""
-        client = APIClient()
-        client.token = "test_token"
+        httpx_stub.get = async_return(mock_httpx_response(200, [test_user_data]))
 
-        response = mock_httpx_response(200, [test_user_data])
+        result = await authed_client.get_users()
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.get = AsyncMock(return_value=response)
+        assert len(result) == 1
+        assert result[0]["email"] == "admin@test.com"
 
-            result = await client.get_users()
-
-            assert len(result) == 1
-            assert result[0]["email"] == "admin@test.com"
-
-    async def test_create_load(self, mock_httpx_response):
+    async def test_create_load(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test creating new load."""
-        client = APIClient()
-        client.token = "test_token"
-
         load_data = {
             "reference": "LOAD999",
             "direction": "IB",
@@ -412,23 +277,17 @@ class TestAPIClientOtherEndpoints:
             "version": 1,
         }
 
-        response = mock_httpx_response(201, created_load)
+        httpx_stub.post = async_return(mock_httpx_response(201, created_load))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
+        result = await authed_client.create_load(load_data)
 
-            result = await client.create_load(load_data)
+        assert result["id"] == 99
+        assert result["reference"] == "LOAD999"
 
-            assert result["id"] == 99
-            assert result["reference"] == "LOAD999"
-
-    async def test_create_ramp(self, mock_httpx_response):
+    async def test_create_ramp(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test creating new ramp (admin only)."""
-        client = APIClient()
-        client.token = "test_token"
-
         ramp_data = {
             "code": "R99",
             "description": "Test Ramp",
@@ -442,23 +301,17 @@ class TestAPIClientOtherEndpoints:
             "version": 1,
         }
 
-        response = mock_httpx_response(201, created_ramp)
-
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
+        httpx_stub.post = async_return(mock_httpx_response(201, created_ramp))
 
-            result = await client.create_ramp(ramp_data)
+        result = await authed_client.create_ramp(ramp_data)
 
-            assert result["id"] == 99
-            assert result["code"] == "R99"
+        assert result["id"] == 99
+        assert result["code"] == "R99"
 
-    async def test_create_user(self, mock_httpx_response):
+    async def test_create_user(
+        self, authed_client, httpx_stub, mock_httpx_response, async_return
+    ):
         """Test creating new user (admin only)."""
-        client = APIClient()
-        client.token = "test_token"
-
         user_data = {
             "email": "newuser@test.com",
             "full_name": "New User",
@@ -475,23 +328,101 @@ class TestAPIClientOtherEndpoints:
             "version": 1,
         }
 
-        response = mock_httpx_response(201, created_user)
+        httpx_stub.post = async_return(mock_httpx_response(201, created_user))
 
-        with patch("httpx.AsyncClient") as mock_async_client:
-            mock_context = AsyncMock()
-            mock_async_client.return_value.__aenter__.return_value = mock_context
-            mock_context.post = AsyncMock(return_value=response)
+        result = await authed_client.create_user(user_data)
 
-            result = await client.create_user(user_data)
-
-            assert result["id"] == 99
-            assert result["email"] == "newuser@test.com"
+        assert result["id"] == 99
+        assert result["email"] == "newuser@test.com"
 
 
 class TestAPIClientErrorHandling:
     """Test error handling."""
 
-    async def test_api_error_exception(self):
+    @pytest.mark.parametrize(
+        ("method", "args", "http_method", "response", "detail"),
+        [
+            pytest.param(
+                "login",
+                ("wrong@test.com", "wrongpass"),
+                "post",
+                (401, {"detail": "Invalid credentials"}),
+                "Invalid credentials",
+                id="login-invalid-credentials",
+            ),
+            pytest.param(
+                "login",
+                ("admin@test.com", "admin123"),
+                "post",
+                (500, {"detail": "Internal server error"}),
+                "Internal server error",
+                id="login-server-error",
+            ),
+            pytest.param(
+                "get_assignment",
+                (999,),
+                "get",
+                (404, None, "Assignment not found"),
+                "Assignment not found",
+                id="get-assignment-not-found",
+            ),
+            pytest.param(
+                "create_assignment",
+                ({},),
+                "post",
+                (422, {"detail": "Validation error"}),
+                "Validation error",
+                id="create-assignment-invalid-data",
+            ),
+            pytest.param(
+                "update_assignment",
+                (1, {"status_id": 2, "version": 1}),
+                "patch",
+                (
+                    409,
+                    {
+                        "detail": {
+                            "detail": "Version conflict",
+                            "current_version": 3,
+                            "provided_version": 1,
+                        }
+                    },
+                ),
+                "Version conflict",
+                id="update-assignment-version-conflict",
+            ),
+            pytest.param(
+                "delete_assignment",
+                (999,),
+                "delete",
+                (404, None, "Assignment not found"),
+                "Assignment not found",
+                id="delete-assignment-not-found",
+            ),
+        ],
+    )
+    async def test_error_response_raises_api_error(
+        self,
+        authed_client,
+        httpx_stub,
+        mock_httpx_response,
+        async_return,
+        method: str,
+        args: tuple,
+        http_method: str,
+        response: tuple,
+        detail: str,
+    ):
+        """Test non-success responses raise APIError with the response status."""
+        setattr(httpx_stub, http_method, async_return(mock_httpx_response(*response)))
+
+        with pytest.raises(APIError) as exc_info:
+            await getattr(authed_client, method)(*args)
+
+        assert exc_info.value.status_code == response[0]
+        assert detail in exc_info.value.detail
+
+    def test_api_error_exception(self):
         """Test APIError exception properties."""
         error = APIError(404, "Not found")
 
@@ -500,22 +431,24 @@ class TestAPIClientErrorHandling:
         assert "404" in str(error)
         assert "Not found" in str(error)
 
-    async def test_headers_without_token(self):
-        """Test _headers raises error when not authenticated."""
+    @pytest.mark.parametrize(
+        ("token", "expected_status"),
+        [
+            pytest.param(None, 401, id="without-token"),
+            pytest.param("test_token_123", None, id="with-token"),
+        ],
+    )
+    def test_headers(self, token: Optional[str], expected_status: Optional[int]):
+        """Test _headers requires a token and builds the bearer header from it."""
         client = APIClient()
+        client.token = token
+
+        if expected_status is None:
+            assert client._headers() == {"Authorization": f"Bearer {token}"}
+            return
 
         with pytest.raises(APIError) as exc_info:
             client._headers()
 
-        assert exc_info.value.status_code == 401
+        assert exc_info.value.status_code == expected_status
         assert "Not authenticated" in exc_info.value.detail
-
-    async def test_headers_with_token(self):
-        """Test _headers returns proper authorization header."""
-        client = APIClient()
-        client.token = "test_token_123"
-
-        headers = client._headers()
-
-        assert "Authorization" in headers
-        assert headers["Authorization"] == "Bearer test_token_123"
@@ -0,0 +1,79 @@
+"""Tests for datetime helpers."""
+from datetime import datetime
+
+import pytest
+
+from app.core.datetime_utils import parse_local_datetime
+
+
+class TestParseLocalDatetime:
+    """Test parse_local_datetime."""
+
+    def test_valid_value(self):
+        """Test a zero-padded value parses like strptime."""
+        value = "2025-01-05 09:30"
+
+        result = parse_local_datetime(value)
+
+        assert result == datetime(2025, 1, 5, 9, 30)
+        assert result == datetime.strptime(value, "%Y-%m-%d %H:%M")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("2025-01-05 09:3", id="too-short"),
+            pytest.param("2025-01-05 09:300", id="too-long"),
+            pytest.param("2024-1-5 9:30", id="not-zero-padded"),
+            pytest.param("2025-01-05T09:30:00", id="iso-with-seconds"),
+        ],
+    )
+    def test_wrong_length(self, value: str):
+        """Test values that aren't exactly 16 characters are rejected."""
+        with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM"):
+            parse_local_datetime(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("2025/01/05 09:30", id="slashes"),
+            pytest.param("2025-01-05T09:30", id="t-separator"),
+            pytest.param("2025-01-05 09.30", id="dot-time"),
+            pytest.param("20250-1-05 09:30", id="shifted-dash"),
+        ],
+    )
+    def test_wrong_separators(self, value: str):
+        """Test separators must be '-', '-', ' ' and ':' at fixed positions."""
+        with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM"):
+            parse_local_datetime(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("２０２５-01-05 09:30", id="fullwidth-digits"),
+            pytest.param("2025-٠١-05 09:30", id="arabic-indic-digits"),
+            pytest.param("2025-01-05 0a:30", id="letter"),
+            pytest.param("2025-01-05 +9:30", id="sign"),
+            pytest.param("2025-01-05  9:30", id="space-padding"),
+        ],
+    )
+    def test_non_ascii_digit_fields(self, value: str):
+        """Test every field must be plain ASCII digits."""
+        with pytest.raises(ValueError, match="YYYY-MM-DD HH:MM"):
+            parse_local_datetime(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("2025-13-05 09:30", id="month-13"),
+            pytest.param("2025-00-05 09:30", id="month-0"),
+            pytest.param("2025-02-30 09:30", id="feb-30"),
+            pytest.param("2025-01-00 09:30", id="day-0"),
+            pytest.param("2025-01-05 24:00", id="hour-24"),
+            pytest.param("2025-01-05 09:60", id="minute-60"),
+        ],
+    )
+    def test_out_of_range(self, value: str):
+        """Test well-formed but impossible dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_local_datetime(value)
@@ -0,0 +1,86 @@
+"""Tests for DockDashboardScreen live updates."""
+import asyncio
+import copy
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+
+from app.screens.dock_dashboard import DockDashboardScreen
+from app.services.websocket_client import WebSocketClient
+from tests.helpers import AsyncStream
+
+
+@pytest.fixture
+def dashboard(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_api_client,
+    ws_client: WebSocketClient,
+    test_ramps,
+    test_assignments,
+) -> DockDashboardScreen:
+    """
+    Return an unmounted dashboard holding the sample data.
+
+    Widget refreshes are stubbed out; summary updates are recorded in
+    ``dashboard.summary_deltas`` instead.
+    """
+    screen = DockDashboardScreen(mock_api_client, ws_client, {})
+    screen.ramps = list(test_ramps)
+    screen.assignments = copy.deepcopy(list(test_assignments))
+    screen.summary_deltas = []
+
+    monkeypatch.setattr(screen, "_hydrate_status_options", lambda: None)
+    monkeypatch.setattr(screen, "_apply_filters", lambda: None)
+    monkeypatch.setattr(
+        screen, "_update_summary_widgets", lambda delta=None: screen.summary_deltas.append(delta)
+    )
+
+    # Same registrations as on_mount
+    for event_type in ("assignment_created", "assignment_updated", "assignment_deleted"):
+        ws_client.on_message(event_type, screen._handle_assignment_event)
+    return screen
+
+
+async def _deliver(ws_client: WebSocketClient, *messages: Dict[str, Any]) -> None:
+    """Feed server messages through the client's listener and wait for its callbacks."""
+    ws_client.websocket = AsyncStream([orjson.dumps(message) for message in messages])
+    await ws_client._listen()
+    await asyncio.gather(*ws_client._callback_tasks)
+
+
+class TestDashboardLiveUpdates:
+    """Test WebSocket assignment events reach the dashboard."""
+
+    async def test_assignment_updated_patches_in_place(
+        self, dashboard: DockDashboardScreen, ws_client: WebSocketClient
+    ):
+        """Test an assignment_updated message replaces the assignment and reports the delta."""
+        old = dashboard.assignments[0]
+        new = {**old, "status_id": 2, "version": 2}
+
+        await _deliver(
+            ws_client,
+            {"type": "assignment_updated", "assignment_id": old["id"], "data": new},
+        )
+
+        assert dashboard.assignments[0] == new
+        assert len(dashboard.assignments) == 2
+        assert dashboard.summary_deltas == [(old, new)]
+
+    async def test_assignment_created_and_deleted(
+        self, dashboard: DockDashboardScreen, ws_client: WebSocketClient
+    ):
+        """Test created assignments are appended and deleted ones removed."""
+        created = {**dashboard.assignments[1], "id": 99, "ramp_id": 2}
+        deleted = dashboard.assignments[0]
+
+        await _deliver(
+            ws_client,
+            {"type": "assignment_created", "assignment_id": 99, "data": created},
+            {"type": "assignment_deleted", "assignment_id": deleted["id"], "data": deleted},
+        )
+
+        ids: List[int] = [a["id"] for a in dashboard.assignments]
+        assert ids == [2, 99]
+        assert dashboard.summary_deltas == [(None, created), (deleted, None)]
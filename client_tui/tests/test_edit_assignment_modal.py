@@ -0,0 +1,94 @@
+"""Tests for EditAssignmentModal."""
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import pytest
+from textual.app import App
+from textual.widgets import Input, Static
+
+from app.widgets.modals.edit_assignment_modal import EditAssignmentModal
+
+
+class RefreshAPI:
+    """API stand-in returning a fresh assignment, optionally after a user edit."""
+
+    def __init__(
+        self,
+        statuses: Sequence[Dict[str, Any]],
+        fresh: Dict[str, Any],
+        while_loading: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.statuses = statuses
+        self.fresh = fresh
+        # Runs while get_assignment is in flight, e.g. to type into an input
+        self.while_loading = while_loading
+
+    async def get_statuses(self) -> Sequence[Dict[str, Any]]:
+        return self.statuses
+
+    async def get_assignment(self, assignment_id: int) -> Dict[str, Any]:
+        if self.while_loading is not None:
+            self.while_loading()
+        return self.fresh
+
+
+class ModalApp(App[None]):
+    """Bare app that opens the modal on mount."""
+
+    def __init__(self, modal: EditAssignmentModal) -> None:
+        super().__init__()
+        self.modal = modal
+
+    async def on_mount(self) -> None:
+        await self.push_screen(self.modal)
+
+
+@pytest.fixture
+def fresh_assignment(test_assignments) -> Dict[str, Any]:
+    """Return the first sample assignment as re-fetched with newer values."""
+    return {
+        **test_assignments[0],
+        "eta_in": "2025-01-05T15:00:00",
+        "eta_out": "2025-01-05T17:00:00",
+        "ramp": {**test_assignments[0]["ramp"], "description": "Ramp 1 Moved"},
+        "version": 2,
+    }
+
+
+@pytest.mark.real_sleep
+class TestEditAssignmentModalRefresh:
+    """Test the modal's refresh from the freshly fetched assignment."""
+
+    async def test_untouched_inputs_follow_fresh_assignment(
+        self, test_assignments, test_statuses, fresh_assignment
+    ):
+        """Test inputs still showing the original values take the fresh ones."""
+        modal = EditAssignmentModal(
+            RefreshAPI(test_statuses, fresh_assignment), test_assignments[0]
+        )
+
+        async with ModalApp(modal).run_test() as pilot:
+            await pilot.pause()
+
+            assert modal.query_one("#eta-in-input", Input).value == "2025-01-05 15:00"
+            assert modal.query_one("#eta-out-input", Input).value == "2025-01-05 17:00"
+            info = str(modal.query_one("#assignment-info", Static).render())
+            assert "Ramp 1 Moved" in info
+            assert modal.assignment["version"] == 2
+
+    async def test_edited_input_kept(self, test_assignments, test_statuses, fresh_assignment):
+        """Test an ETA edited before the fetch returns is not overwritten."""
+        modal = EditAssignmentModal(
+            RefreshAPI(test_statuses, fresh_assignment), test_assignments[0]
+        )
+
+        def edit_eta_in() -> None:
+            modal.query_one("#eta-in-input", Input).value = "2025-01-06 08:00"
+
+        modal.api_client.while_loading = edit_eta_in
+
+        async with ModalApp(modal).run_test() as pilot:
+            await pilot.pause()
+
+            assert modal.query_one("#eta-in-input", Input).value == "2025-01-06 08:00"
+            assert modal.query_one("#eta-out-input", Input).value == "2025-01-05 17:00"
+            assert modal.assignment["version"] == 2
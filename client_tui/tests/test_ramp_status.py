@@ -0,0 +1,35 @@
+"""Tests for RampInfo view-model."""
+from app.services.ramp_status import RampInfo
+
+
+class TestRampInfoDetailMarkup:
+    """Test RampInfo.detail_markup."""
+
+    def test_free_ramp(self):
+        """Test a free ramp renders without the optional sections."""
+        info = RampInfo({"id": 1, "code": "R1", "direction": "IB"})
+
+        markup = info.detail_markup
+
+        assert "Code: [white]R1[/white]" in markup
+        assert "Zone:" not in markup
+        assert "Notes" not in markup
+        assert "Reference: [white]-[/white]" in markup
+
+    def test_non_str_fields(self):
+        """Test None and numeric API values render instead of raising TypeError."""
+        ramp = {"id": 2, "code": None, "zone": 7, "direction": "OB"}
+        assignment = {
+            "id": 5,
+            "status": {"code": "OCCUPIED", "label": "Occupied"},
+            "load": {"reference": "LD-1", "notes": "  dock 4  "},
+            "version": 3,
+        }
+        info = RampInfo(ramp, assignment)
+
+        markup = info.detail_markup
+
+        assert "Code: [white]None[/white]" in markup
+        assert "Zone: [white]7[/white]" in markup
+        assert "[bold green]Notes[/bold green]\ndock 4\n" in markup
+        assert "Version: [white]3[/white]" in markup
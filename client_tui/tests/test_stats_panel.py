@@ -0,0 +1,132 @@
+"""Tests for StatsPanel incremental counters."""
+import copy
+from typing import Any, Dict, List
+
+import pytest
+
+from app.widgets.stats_panel import StatsPanel
+
+
+def _make_panel() -> StatsPanel:
+    """Return an unmounted StatsPanel whose flushes only run when called."""
+    panel = StatsPanel()
+    panel.call_after_refresh = lambda callback, *args, **kwargs: True
+    panel._render_stats = lambda: None
+    return panel
+
+
+def _counters(panel: StatsPanel) -> tuple:
+    return (
+        panel._total_assignments,
+        panel._inbound,
+        dict(panel._status_counter),
+        dict(panel._busy_ramps),
+    )
+
+
+def _recount(assignments: List[Dict[str, Any]]) -> tuple:
+    """Counters from a full bulk recompute of the given assignments."""
+    panel = _make_panel()
+    panel.update_stats(assignments)
+    panel._flush_pending()
+    return _counters(panel)
+
+
+def _assignment(
+    assignment_id: int, ramp_id: int, direction: str = "IB", status: str = "Pending"
+) -> Dict[str, Any]:
+    return {
+        "id": assignment_id,
+        "ramp_id": ramp_id,
+        "load": {"direction": direction},
+        "status": {"label": status},
+    }
+
+
+@pytest.fixture
+def panel_with(test_assignments):
+    """Return (panel, assignments) with the panel counted from a private copy."""
+    assignments = copy.deepcopy(list(test_assignments))
+    panel = _make_panel()
+    panel.update_stats(assignments)
+    panel._flush_pending()
+    return panel, assignments
+
+
+class TestStatsPanelDelta:
+    """Test apply_delta keeps counters equal to a full recount."""
+
+    def test_create(self, panel_with):
+        """Test a created assignment is added to every counter."""
+        panel, assignments = panel_with
+        new = _assignment(10, ramp_id=3, direction="OB", status="Arrived")
+        assignments.append(new)
+
+        panel.apply_delta(None, new)
+
+        assert _counters(panel) == _recount(assignments)
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            pytest.param({"status": {"label": "Completed"}}, id="status-change"),
+            pytest.param({"ramp_id": 7}, id="ramp-change"),
+            pytest.param({"load": {"direction": "OB"}}, id="direction-change"),
+        ],
+    )
+    def test_update(self, panel_with, changes: Dict[str, Any]):
+        """Test an update moves the assignment's contribution, not just adds it."""
+        panel, assignments = panel_with
+        old = assignments[0]
+        new = {**old, **changes}
+        assignments[0] = new
+
+        panel.apply_delta(old, new)
+
+        assert _counters(panel) == _recount(assignments)
+
+    def test_delete(self, panel_with):
+        """Test a deleted assignment is removed and empty buckets disappear."""
+        panel, assignments = panel_with
+        old = assignments.pop(0)
+
+        panel.apply_delta(old, None)
+
+        assert _counters(panel) == _recount(assignments)
+        assert old["ramp_id"] not in panel._busy_ramps
+
+    def test_two_assignments_on_one_ramp(self):
+        """Test a ramp stays busy until its last assignment is gone."""
+        panel = _make_panel()
+        first = _assignment(1, ramp_id=4)
+        second = _assignment(2, ramp_id=4, status="Arrived")
+        assignments = [first, second]
+
+        panel.apply_delta(None, first)
+        panel.apply_delta(None, second)
+        assert _counters(panel) == _recount(assignments)
+        assert len(panel._busy_ramps) == 1
+
+        assignments.remove(first)
+        panel.apply_delta(first, None)
+        assert _counters(panel) == _recount(assignments)
+        assert panel._busy_ramps == {4: 1}
+
+        assignments.remove(second)
+        panel.apply_delta(second, None)
+        assert _counters(panel) == _recount(assignments)
+        assert not panel._busy_ramps
+
+    def test_delta_while_bulk_update_pending(self, panel_with):
+        """Test a delta arriving before a pending bulk recompute is not counted twice."""
+        panel, assignments = panel_with
+        live = list(assignments)
+        panel.update_stats(live)
+
+        # The parent mutates its live list, then reports the delta
+        new = _assignment(10, ramp_id=3)
+        live.append(new)
+        panel.apply_delta(None, new)
+        panel._flush_pending()
+
+        assert _counters(panel) == _recount(live)
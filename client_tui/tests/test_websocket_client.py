@@ -1,15 +1,39 @@
 """Tests for WebSocketClient."""
 import asyncio
 import json
-from typing import Any, Dict
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from typing import Any, AsyncIterator, Dict, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 import websockets
+
+from app.services import websocket_client
 from app.services.websocket_client import WebSocketClient
+from tests.helpers import AsyncStream, ClosedWS, FakeWS
+
+
+def _finished_task() -> asyncio.Future:
+    """Return an already-resolved future standing in for the listener task."""
+    # Awaiting a done future returns immediately, without a scheduler round-trip
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
 
 
-pytestmark = pytest.mark.asyncio
+@pytest.fixture
+def fake_ws(ws_client: WebSocketClient) -> FakeWS:
+    """Install a FakeWS as ws_client's socket and return it."""
+    ws_client.websocket = FakeWS()
+    return ws_client.websocket
+
+
+@pytest.fixture
+async def writer(ws_client: WebSocketClient) -> AsyncIterator[asyncio.Task]:
+    """Start ws_client's writer task, as connect() does, and cancel it afterwards."""
+    task = ws_client._writer_task = asyncio.create_task(ws_client._writer())
+    yield task
+    task.cancel()
 
 
 class TestWebSocketConnection:
@@ -33,68 +57,71 @@ class TestWebSocketConnection:
 
         assert "Token not set" in str(exc_info.value)
 
-    async def test_connect_success(self, test_token: str):
+    async def test_connect_success(
+        self, ws_client: WebSocketClient, mock_ws: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test successful WebSocket connection."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
+        mock_connect = AsyncMock(return_value=mock_ws)
+        monkeypatch.setattr(websocket_client, "_ws_connect", mock_connect)
 
-        mock_websocket = AsyncMock()
+        with patch("asyncio.create_task") as mock_create_task:
+            mock_task = MagicMock()
 
-        with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_websocket
+            def fake_create_task(coro):
+                coro.close()  # listener never runs; don't leak the coroutine
+                return mock_task
 
-            with patch("asyncio.create_task") as mock_create_task:
-                mock_task = MagicMock()
-                mock_create_task.return_value = mock_task
+            mock_create_task.side_effect = fake_create_task
 
-                await client.connect()
+            await client.connect()
 
-                assert client.websocket == mock_websocket
-                assert client.running is True
-                assert client._task == mock_task
-                mock_connect.assert_called_once()
+        assert client.websocket == mock_ws
+        assert client.running is True
+        assert client._task == mock_task
+        mock_connect.assert_called_once()
+        assert mock_connect.call_args.kwargs["compression"] is None
 
-    async def test_connect_timeout(self, test_token: str):
+    async def test_connect_timeout(
+        self, ws_client: WebSocketClient, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test connection timeout raises TimeoutError."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
+
+        async def hanging_connect(*args: Any, **kwargs: Any) -> None:
+            await asyncio.Event().wait()
 
-        with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
-            with pytest.raises(asyncio.TimeoutError):
-                await client.connect()
+        monkeypatch.setattr(websocket_client, "CONNECT_TIMEOUT", 0)
+        monkeypatch.setattr(websocket_client, "_ws_connect", hanging_connect)
 
-    async def test_connect_failure(self, test_token: str):
+        with pytest.raises(asyncio.TimeoutError):
+            await client.connect()
+
+    async def test_connect_failure(
+        self, ws_client: WebSocketClient, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test connection failure raises exception."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
+        monkeypatch.setattr(
+            websocket_client, "_ws_connect", AsyncMock(side_effect=Exception("Connection refused"))
+        )
 
-        with patch("websockets.connect", side_effect=Exception("Connection refused")):
-            with pytest.raises(Exception) as exc_info:
-                await client.connect()
+        with pytest.raises(Exception) as exc_info:
+            await client.connect()
 
-            assert "Connection refused" in str(exc_info.value)
+        assert "Connection refused" in str(exc_info.value)
 
-    async def test_disconnect(self, test_token: str):
+    async def test_disconnect(self, ws_client: WebSocketClient, mock_ws: AsyncMock):
         """Test disconnecting from WebSocket."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
         client.running = True
 
-        mock_websocket = AsyncMock()
-
-        # Create a proper async mock task
-        async def mock_task_coro():
-            pass
-
-        mock_task = asyncio.create_task(mock_task_coro())
-
-        client.websocket = mock_websocket
-        client._task = mock_task
+        client._task = _finished_task()
 
         await client.disconnect()
 
         assert client.running is False
-        mock_websocket.close.assert_called_once()
+        mock_ws.close.assert_called_once()
 
 
 class TestWebSocketMessages:
@@ -116,100 +143,261 @@ class TestWebSocketMessages:
         client.callbacks["test_type"]({"type": "test_type"})
         assert callback_called is True
 
-    async def test_subscribe_without_filter(self, test_token: str):
-        """Test subscribing without direction filter."""
-        client = WebSocketClient()
-        client.set_token(test_token)
-
-        mock_websocket = AsyncMock()
-        client.websocket = mock_websocket
-
-        await client.subscribe()
+    @pytest.mark.parametrize(
+        ("direction", "expected_filters"),
+        [
+            pytest.param(None, None, id="without-filter"),
+            pytest.param("IB", {"direction": "IB"}, id="with-direction-filter"),
+        ],
+    )
+    async def test_subscribe(
+        self,
+        ws_client: WebSocketClient,
+        fake_ws: FakeWS,
+        writer: asyncio.Task,
+        direction: Optional[str],
+        expected_filters: Optional[Dict[str, str]],
+    ):
+        """Test subscribing with and without a direction filter."""
+        client = ws_client
+
+        await client.subscribe(direction=direction)
+        await client.flush()
 
         # Verify send was called with correct message
-        mock_websocket.send.assert_called_once()
-        sent_data = json.loads(mock_websocket.send.call_args[0][0])
+        assert len(fake_ws.sent) == 1
+        sent_data = json.loads(fake_ws.sent[0])
         assert sent_data["type"] == "subscribe"
-        assert "filters" not in sent_data
-
-    async def test_subscribe_with_direction_filter(self, test_token: str):
-        """Test subscribing with direction filter."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        assert sent_data.get("filters") == expected_filters
 
-        mock_websocket = AsyncMock()
-        client.websocket = mock_websocket
-
-        await client.subscribe(direction="IB")
-
-        # Verify send was called with correct message
-        mock_websocket.send.assert_called_once()
-        sent_data = json.loads(mock_websocket.send.call_args[0][0])
-        assert sent_data["type"] == "subscribe"
-        assert sent_data["filters"]["direction"] == "IB"
-
-    async def test_unsubscribe(self, test_token: str):
+    async def test_unsubscribe(self, ws_client: WebSocketClient, fake_ws: FakeWS, writer: asyncio.Task):
         """Test unsubscribing (clearing filters)."""
-        client = WebSocketClient()
-        client.set_token(test_token)
-
-        mock_websocket = AsyncMock()
-        client.websocket = mock_websocket
+        client = ws_client
 
         await client.unsubscribe()
+        await client.flush()
 
         # Verify send was called with correct message
-        mock_websocket.send.assert_called_once()
-        sent_data = json.loads(mock_websocket.send.call_args[0][0])
+        assert len(fake_ws.sent) == 1
+        sent_data = json.loads(fake_ws.sent[0])
         assert sent_data["type"] == "unsubscribe"
 
-    async def test_ping(self, test_token: str):
+    async def test_ping(self, ws_client: WebSocketClient, fake_ws: FakeWS, writer: asyncio.Task):
         """Test sending ping message."""
-        client = WebSocketClient()
-        client.set_token(test_token)
-
-        mock_websocket = AsyncMock()
-        client.websocket = mock_websocket
+        client = ws_client
 
         await client.ping()
+        await client.flush()
 
         # Verify send was called with correct message
-        mock_websocket.send.assert_called_once()
-        sent_data = json.loads(mock_websocket.send.call_args[0][0])
+        assert len(fake_ws.sent) == 1
+        sent_data = json.loads(fake_ws.sent[0])
         assert sent_data["type"] == "ping"
 
-    async def test_subscribe_without_websocket(self):
-        """Test subscribe without active WebSocket connection."""
-        client = WebSocketClient()
-        client.websocket = None
+    async def test_queued_messages_sent_as_one_frame(
+        self, ws_client: WebSocketClient, fake_ws: FakeWS, writer: asyncio.Task
+    ):
+        """Test a burst of control messages is flushed as a single JSON array frame."""
+        client = ws_client
 
-        # Should not raise exception, just return early
-        await client.subscribe()
+        await client.subscribe(direction="OB")
+        await client.ping()
+        client.send_batch([{"type": "unsubscribe"}])
+        await client.flush()
+
+        assert len(fake_ws.sent) == 1
+        sent_data = json.loads(fake_ws.sent[0])
+        assert [m["type"] for m in sent_data] == ["subscribe", "ping", "unsubscribe"]
+        assert sent_data[0]["filters"]["direction"] == "OB"
+
+    @pytest.mark.real_sleep
+    async def test_batch_sends_one_frame(
+        self, ws_client: WebSocketClient, fake_ws: FakeWS, writer: asyncio.Task
+    ):
+        """Test messages queued inside batch() go out as one frame, even with the writer running."""
+        client = ws_client
+
+        async with client.batch():
+            for direction in ("IB", "OB", None):
+                await client.subscribe(direction=direction)
+                # Let the writer run; it must not send while the batch is open
+                await asyncio.sleep(0)
+            await client.unsubscribe()
+            await client.ping()
+            assert fake_ws.sent == []
+
+        assert len(fake_ws.sent) == 1
+        sent_data = json.loads(fake_ws.sent[0])
+        assert [m["type"] for m in sent_data] == [
+            "subscribe", "subscribe", "subscribe", "unsubscribe", "ping"
+        ]
+
+    @pytest.mark.real_sleep
+    async def test_writer_wakes_on_append(self, ws_client: WebSocketClient, fake_ws: FakeWS):
+        """Test the idle writer parks on a future and sends as soon as a message is queued."""
+        client = ws_client
+        writer = asyncio.create_task(client._writer())
+
+        try:
+            await asyncio.sleep(0)
+            assert client._out_waiter is not None
+
+            await client.ping()
+            await asyncio.sleep(0)
+
+            assert [json.loads(frame) for frame in fake_ws.sent] == [{"type": "ping"}]
+        finally:
+            writer.cancel()
+
+    async def test_flush_without_writer_raises(self, ws_client: WebSocketClient, fake_ws: FakeWS):
+        """Test flush() refuses to run without a writer and keeps the queue intact."""
+        client = ws_client
 
-    async def test_unsubscribe_without_websocket(self):
-        """Test unsubscribe without active WebSocket connection."""
-        client = WebSocketClient()
-        client.websocket = None
+        await client.ping()
 
-        # Should not raise exception, just return early
-        await client.unsubscribe()
+        with pytest.raises(RuntimeError, match="writer is not running"):
+            await client.flush()
+        assert list(client._out) == [websocket_client._PING]
+        assert fake_ws.sent == []
+
+    async def test_batch_without_writer_keeps_messages_queued(
+        self, ws_client: WebSocketClient, fake_ws: FakeWS
+    ):
+        """Test leaving batch() before connect() leaves messages for the writer."""
+        client = ws_client
+
+        async with client.batch():
+            await client.ping()
+
+        assert list(client._out) == [websocket_client._PING]
+        assert fake_ws.sent == []
+
+    async def test_full_queue_counts_dropped(
+        self, ws_client: WebSocketClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test appending to a full queue drops the oldest message and counts it."""
+        client = ws_client
+        monkeypatch.setattr(websocket_client, "_OUT_MAXLEN", 2)
+        client._out = websocket_client.deque(maxlen=2)
+
+        client.send_batch([{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert [orjson.loads(m)["n"] for m in client._out] == [2, 3]
+        assert client._dropped == 1
+
+    async def test_send_on_closed_socket_requeues(self, ws_client: WebSocketClient):
+        """Test a batch that hits ConnectionClosed goes back to the head of the queue."""
+        client = ws_client
+        client.websocket = ClosedWS()
+        client._out.append(websocket_client._UNSUBSCRIBE)
+
+        sent = await client._send_frame([websocket_client._SUBSCRIBE_ALL, websocket_client._PING])
+
+        assert sent is False
+        assert list(client._out) == [
+            websocket_client._SUBSCRIBE_ALL, websocket_client._PING, websocket_client._UNSUBSCRIBE
+        ]
+        assert client._dropped == 0
+
+    @pytest.mark.real_sleep
+    async def test_requeued_messages_sent_after_reconnect(
+        self, ws_client: WebSocketClient, mock_ws: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the writer stops on a closed socket and reconnect sends what it held."""
+        client = ws_client
+        client.websocket = ClosedWS()
+        client._writer_task = asyncio.create_task(client._writer())
+
+        await client.ping()
+        await client._writer_task
+
+        assert list(client._out) == [websocket_client._PING]
+
+        reopened = FakeWS()
+        monkeypatch.setattr(websocket_client, "_ws_connect", AsyncMock(return_value=reopened))
 
-    async def test_ping_without_websocket(self):
-        """Test ping without active WebSocket connection."""
+        async def idle_listen(self: WebSocketClient) -> None:
+            pass
+
+        monkeypatch.setattr(WebSocketClient, "_listen", idle_listen)
+        try:
+            await client._connect_once()
+            await asyncio.sleep(0)
+            assert [json.loads(frame) for frame in reopened.sent] == [{"type": "ping"}]
+        finally:
+            client._writer_task.cancel()
+
+    async def test_disconnect_without_writer(self, ws_client: WebSocketClient, fake_ws: FakeWS):
+        """Test disconnect() closes the socket even when the writer never started."""
+        client = ws_client
+        client._task = _finished_task()
+        await client.ping()
+
+        await client.disconnect()
+
+        assert fake_ws.closed is True
+        assert fake_ws.sent == []
+
+    @pytest.mark.real_sleep
+    async def test_disconnect_stops_writer_and_callbacks(
+        self, ws_client: WebSocketClient, fake_ws: FakeWS, writer: asyncio.Task
+    ):
+        """Test nothing the client started is still running once disconnect() returns."""
+        client = ws_client
+        client._task = _finished_task()
+        callback = asyncio.ensure_future(asyncio.Event().wait())
+        client._callback_tasks.add(callback)
+        await asyncio.sleep(0)
+
+        await client.disconnect()
+
+        assert writer.done()
+        assert client._writer_task is None
+        assert callback.cancelled()
+        assert not client._callback_tasks
+        assert fake_ws.closed is True
+
+    async def test_disconnect_from_async_callback(
+        self, ws_client: WebSocketClient, fake_ws: FakeWS
+    ):
+        """Test an async callback can disconnect without cancelling itself."""
+        client = ws_client
+        client._task = _finished_task()
+        client.on_message("*", lambda data: client.disconnect())
+        client.websocket = AsyncStream([orjson.dumps({"type": "bye"})])
+
+        await client._listen()
+        (callback,) = client._callback_tasks
+        await callback
+
+        assert not callback.cancelled()
+        assert client.running is False
+
+    @pytest.mark.parametrize("method_name", ["subscribe", "unsubscribe", "ping"])
+    async def test_control_message_without_websocket(self, method_name: str):
+        """Test control messages without active WebSocket connection."""
         client = WebSocketClient()
         client.websocket = None
 
         # Should not raise exception, just return early
-        await client.ping()
+        await getattr(client, method_name)()
 
 
 class TestWebSocketListen:
     """Test WebSocket message listening."""
 
-    async def test_listen_calls_registered_callback(self, test_token: str):
-        """Test _listen calls registered callback for message type."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+    @pytest.mark.parametrize(
+        ("message_type", "register_type"),
+        [
+            pytest.param("assignment_update", "assignment_update", id="registered"),
+            pytest.param("some_type", "*", id="generic"),
+        ],
+    )
+    async def test_listen_calls_callback(
+        self, ws_client: WebSocketClient, message_type: str, register_type: str
+    ):
+        """Test _listen calls the callback registered for the type, or the generic (*) one."""
+        client = ws_client
 
         # Track callback calls
         callback_data = []
@@ -217,77 +405,76 @@ class TestWebSocketListen:
         def test_callback(data: Dict[str, Any]) -> None:
             callback_data.append(data)
 
-        client.on_message("assignment_update", test_callback)
+        client.on_message(register_type, test_callback)
+        # The generic callback is held outside the typed dispatch dict
+        assert (register_type in (client.callbacks or {})) is (register_type != "*")
 
-        # Mock websocket that yields one message then stops
-        mock_websocket = MagicMock()
-        test_message = {"type": "assignment_update", "data": {"id": 1}}
-
-        async def mock_messages():
-            yield json.dumps(test_message)
-
-        # Make the mock websocket properly async iterable
-        mock_websocket.__aiter__ = lambda self: mock_messages()
-        client.websocket = mock_websocket
+        # Websocket that yields one message then stops
+        test_message = {"type": message_type, "data": {"id": 1}}
+        client.websocket = AsyncStream([orjson.dumps(test_message)])
 
         # Run _listen (it will process one message then stop)
         await client._listen()
 
         # Verify callback was called with correct data
         assert len(callback_data) == 1
-        assert callback_data[0]["type"] == "assignment_update"
+        assert callback_data[0]["type"] == message_type
         assert callback_data[0]["data"]["id"] == 1
 
-    async def test_listen_calls_generic_callback(self, test_token: str):
-        """Test _listen calls generic callback (*) for all messages."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+    async def test_listen_sees_callbacks_registered_while_running(
+        self, ws_client: WebSocketClient
+    ):
+        """Test callbacks registered after _listen has started still receive messages."""
+        client = ws_client
+        late_data = []
 
-        # Track callback calls
-        callback_data = []
+        def register_late(data: Dict[str, Any]) -> None:
+            client.on_message("late_type", late_data.append)
 
-        def generic_callback(data: Dict[str, Any]) -> None:
-            callback_data.append(data)
+        # Only the generic callback exists when the listener starts
+        client.on_message("*", register_late)
+        client.websocket = AsyncStream(
+            [orjson.dumps({"type": "first_type"}), orjson.dumps({"type": "late_type"})]
+        )
 
-        client.on_message("*", generic_callback)
+        await client._listen()
 
-        # Mock websocket that yields one message
-        mock_websocket = MagicMock()
-        test_message = {"type": "some_type", "data": {"value": 123}}
+        assert late_data == [{"type": "late_type"}]
 
-        async def mock_messages():
-            yield json.dumps(test_message)
+    async def test_listen_runs_async_callbacks(self, ws_client: WebSocketClient):
+        """Test coroutine callbacks are scheduled and actually run, not dropped."""
+        client = ws_client
+        typed_data = []
+        generic_data = []
 
-        # Make the mock websocket properly async iterable
-        mock_websocket.__aiter__ = lambda self: mock_messages()
-        client.websocket = mock_websocket
+        async def typed_callback(data: Dict[str, Any]) -> None:
+            typed_data.append(data)
+
+        async def generic_callback(data: Dict[str, Any]) -> None:
+            generic_data.append(data)
+
+        client.on_message("assignment_updated", typed_callback)
+        client.on_message("*", generic_callback)
+        client.websocket = AsyncStream([orjson.dumps({"type": "assignment_updated"})])
 
-        # Run _listen
         await client._listen()
+        await asyncio.gather(*client._callback_tasks)
 
-        # Verify generic callback was called
-        assert len(callback_data) == 1
-        assert callback_data[0]["type"] == "some_type"
+        assert typed_data == [{"type": "assignment_updated"}]
+        assert generic_data == [{"type": "assignment_updated"}]
+        assert not client._callback_tasks
 
-    async def test_listen_handles_callback_exception(self, test_token: str):
+    async def test_listen_handles_callback_exception(self, ws_client: WebSocketClient):
         """Test _listen continues after callback exception."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
 
         def failing_callback(data: Dict[str, Any]) -> None:
             raise ValueError("Test exception")
 
         client.on_message("test_type", failing_callback)
 
-        # Mock websocket
-        mock_websocket = AsyncMock()
         test_message = {"type": "test_type", "data": {}}
-
-        async def mock_messages():
-            yield json.dumps(test_message)
-
-        mock_websocket.__aiter__.return_value = mock_messages()
-        client.websocket = mock_websocket
+        client.websocket = AsyncStream([orjson.dumps(test_message)])
 
         # Should not raise exception, just log it
         await client._listen()
@@ -295,25 +482,23 @@ class TestWebSocketListen:
         # Verify running flag is set to False after listen completes
         assert client.running is False
 
-    async def test_listen_handles_connection_closed(self, test_token: str):
+    async def test_listen_handles_connection_closed(
+        self, ws_client: WebSocketClient, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test _listen handles ConnectionClosed gracefully."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
 
-        # Mock websocket that raises ConnectionClosed
-        mock_websocket = AsyncMock()
-
-        async def mock_messages():
-            raise websockets.exceptions.ConnectionClosed(None, None)
-
-        mock_websocket.__aiter__.side_effect = mock_messages
-
-        client.websocket = mock_websocket
+        # Websocket that raises ConnectionClosed
+        client.websocket = AsyncStream([], exc=websockets.exceptions.ConnectionClosed(None, None))
+        # Slotted instances can't take new attributes; patch the class instead
+        mock_reconnect = AsyncMock()
+        monkeypatch.setattr(WebSocketClient, "_connect_with_retry", mock_reconnect)
 
         # Should not raise exception
         await client._listen()
 
         assert client.running is False
+        mock_reconnect.assert_awaited_once()
 
     async def test_listen_without_websocket(self):
         """Test _listen returns early if no websocket."""
@@ -390,7 +575,9 @@ class TestWebSocketState:
         assert client.base_url == "ws://localhost:8000"
         assert client.websocket is None
         assert client.token is None
-        assert client.callbacks == {}
+        assert not client.callbacks
+        assert client._generic_cb is None
+        assert not hasattr(client, "__dict__")
         assert client.running is False
         assert client._task is None
 
@@ -400,42 +587,35 @@ class TestWebSocketState:
 
         assert client.base_url == "ws://example.com:9000"
 
-    async def test_state_after_connect(self, test_token: str):
+    async def test_state_after_connect(
+        self, ws_client: WebSocketClient, mock_ws: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test state changes after connect."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
+        client.websocket = None
+        monkeypatch.setattr(websocket_client, "_ws_connect", AsyncMock(return_value=mock_ws))
 
-        mock_websocket = AsyncMock()
+        with patch("asyncio.create_task") as mock_create_task:
+            mock_task = MagicMock()
 
-        with patch("websockets.connect", new_callable=AsyncMock) as mock_connect:
-            mock_connect.return_value = mock_websocket
+            def fake_create_task(coro):
+                coro.close()  # listener never runs; don't leak the coroutine
+                return mock_task
 
-            with patch("asyncio.create_task") as mock_create_task:
-                mock_task = MagicMock()
-                mock_create_task.return_value = mock_task
+            mock_create_task.side_effect = fake_create_task
 
-                await client.connect()
+            await client.connect()
 
-                assert client.running is True
-                assert client.websocket is not None
-                assert client._task is not None
+        assert client.running is True
+        assert client.websocket is not None
+        assert client._task is not None
 
-    async def test_state_after_disconnect(self, test_token: str):
+    async def test_state_after_disconnect(self, ws_client: WebSocketClient, mock_ws: AsyncMock):
         """Test state changes after disconnect."""
-        client = WebSocketClient()
-        client.set_token(test_token)
+        client = ws_client
         client.running = True
 
-        mock_websocket = AsyncMock()
-
-        # Create a proper async mock task
-        async def mock_task_coro():
-            pass
-
-        mock_task = asyncio.create_task(mock_task_coro())
-
-        client.websocket = mock_websocket
-        client._task = mock_task
+        client._task = _finished_task()
 
         await client.disconnect()
 